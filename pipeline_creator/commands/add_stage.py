@@ -5,52 +5,38 @@ This module handles adding extra build stages like SonarQube, security scanning,
 """
 
 import click
-import json
-from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Optional
 
 from ..utils.console import (
-    print_success, print_error, print_info, print_warning, 
-    print_step, print_header, confirm
+    print_success, print_error, print_info, print_info_lines, print_warning, 
+    print_step, print_header, confirm, prompt_form
 )
-from ..templates.stages.extra_stages import AVAILABLE_STAGES, get_stage_template
+from ..utils.config import load_config, save_config, ConfigNotFoundError
 
+# Emoji shown next to each build phase in stage listings
+PHASE_EMOJI = {
+    "pre_build": "🚀",
+    "build": "🔨",
+    "post_build": "✅"
+}
 
-def check_config_exists() -> bool:
-    """Check if pipeline configuration exists"""
-    config_path = Path.cwd() / ".pipeline" / "config.json"
-    return config_path.exists()
 
+def index_stages(config: dict) -> Dict[str, dict]:
+    """Index configured extra stages by name, preserving their order"""
+    return {s.get("name"): s for s in config.get("extra_stages", [])}
 
-def load_config() -> dict:
-    """Load pipeline configuration"""
-    config_path = Path.cwd() / ".pipeline" / "config.json"
-    with open(config_path, 'r') as f:
-        return json.load(f)
 
-
-def save_config(config: dict) -> bool:
-    """Save pipeline configuration"""
-    try:
-        config_path = Path.cwd() / ".pipeline" / "config.json"
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
-        return True
-    except Exception as e:
-        print_error(f"Error saving configuration: {str(e)}")
-        return False
-
-
-def add_stage_to_config(config: dict, stage_name: str, stage_config: dict) -> dict:
+def add_stage_to_config(config: dict, stage_name: str, stage_config: dict,
+                        stage_index: Optional[Dict[str, dict]] = None) -> dict:
     """Add stage configuration to pipeline config"""
-    if "extra_stages" not in config:
-        config["extra_stages"] = []
+    if stage_index is None:
+        stage_index = index_stages(config)
     
-    # Remove existing stage with same name
-    config["extra_stages"] = [s for s in config["extra_stages"] if s.get("name") != stage_name]
+    # Replace any existing stage with same name, moving it to the end
+    stage_index.pop(stage_name, None)
+    stage_index[stage_name] = stage_config
     
-    # Add new stage
-    config["extra_stages"].append(stage_config)
+    config["extra_stages"] = list(stage_index.values())
     
     return config
 
@@ -69,9 +55,9 @@ def prompt_for_stage_config(stage_template: dict) -> dict:
     if required_config:
         print_info(f"📋 Configuration required for {stage_template['display_name']}:")
         
-        for key, description in required_config.items():
-            value = click.prompt(f"  {description}", type=str)
-            stage_config["config"][key] = value
+        stage_config["config"] = prompt_form({
+            key: f"  {description}" for key, description in required_config.items()
+        })
     
     return stage_config
 
@@ -94,38 +80,34 @@ def add_stage_command(stage_name: str, list_stages: bool, remove: str, show_conf
         pipeline add-stage --remove snyk # Remove a stage
         pipeline add-stage --show-config # Show current configuration
     """
-    print_header("Add Extra Build Stage")
+    from ..templates.stages.extra_stages import AVAILABLE_STAGES, get_stage_template
     
-    # Check if configuration exists
-    if not check_config_exists():
-        print_error("❌ No pipeline configuration found!")
-        print_info("Run 'pipeline init' first to initialize your pipeline configuration.")
-        return
+    print_header("Add Extra Build Stage")
     
     # Load configuration
     try:
         config = load_config()
+    except ConfigNotFoundError:
+        print_error("❌ No pipeline configuration found!")
+        print_info("Run 'pipeline init' first to initialize your pipeline configuration.")
+        return
     except Exception as e:
         print_error(f"Error loading configuration: {str(e)}")
         return
     
     # List available stages
     if list_stages:
-        print_info("🔧 Available Extra Stages:")
-        print_info("")
+        lines = ["🔧 Available Extra Stages:", ""]
         
         for name, template in AVAILABLE_STAGES.items():
-            phase_emoji = {
-                "pre_build": "🚀",
-                "build": "🔨", 
-                "post_build": "✅"
-            }.get(template["phase"], "⚙️")
+            phase_emoji = PHASE_EMOJI.get(template["phase"], "⚙️")
             
-            print_info(f"  {phase_emoji} {name.ljust(12)} - {template['display_name']}")
-            print_info(f"     {template['description']}")
-            print_info(f"     Phase: {template['phase']}")
-            print_info("")
+            lines.append(f"  {phase_emoji} {name.ljust(12)} - {template['display_name']}")
+            lines.append(f"     {template['description']}")
+            lines.append(f"     Phase: {template['phase']}")
+            lines.append("")
         
+        print_info_lines(lines)
         return
     
     # Show current configuration
@@ -136,27 +118,25 @@ def add_stage_command(stage_name: str, list_stages: bool, remove: str, show_conf
             print_info("ℹ️ No extra stages configured")
             return
         
-        print_info("🔧 Current Extra Stages:")
-        print_info("")
+        lines = ["🔧 Current Extra Stages:", ""]
         
         for stage in extra_stages:
             status = "✅ Enabled" if stage.get("enabled", True) else "❌ Disabled"
-            print_info(f"  • {stage['name']} - {status}")
-            print_info(f"    Phase: {stage['phase']}")
+            lines.append(f"  • {stage['name']} - {status}")
+            lines.append(f"    Phase: {stage['phase']}")
             if stage.get("config"):
-                print_info(f"    Config: {stage['config']}")
-            print_info("")
+                lines.append(f"    Config: {stage['config']}")
+            lines.append("")
         
+        print_info_lines(lines)
         return
     
+    stage_index = index_stages(config)
+    
     # Remove a stage
     if remove:
-        extra_stages = config.get("extra_stages", [])
-        original_count = len(extra_stages)
-        
-        config["extra_stages"] = [s for s in extra_stages if s.get("name") != remove]
-        
-        if len(config["extra_stages"]) < original_count:
+        if stage_index.pop(remove, None) is not None:
+            config["extra_stages"] = list(stage_index.values())
             if save_config(config):
                 print_success(f"✅ Removed stage '{remove}' successfully!")
             else:
@@ -186,10 +166,7 @@ def add_stage_command(stage_name: str, list_stages: bool, remove: str, show_conf
     print_info("")
     
     # Check if stage already exists
-    existing_stages = config.get("extra_stages", [])
-    existing_names = [s.get("name") for s in existing_stages]
-    
-    if stage_name in existing_names:
+    if stage_name in stage_index:
         print_warning(f"⚠️ Stage '{stage_name}' already exists")
         if not confirm("Do you want to replace it?"):
             print_info("Operation cancelled")
@@ -201,7 +178,7 @@ def add_stage_command(stage_name: str, list_stages: bool, remove: str, show_conf
     
     # Add to configuration
     print_step("Updating pipeline configuration...")
-    config = add_stage_to_config(config, stage_name, stage_config)
+    config = add_stage_to_config(config, stage_name, stage_config, stage_index)
     
     # Save configuration
     if save_config(config):
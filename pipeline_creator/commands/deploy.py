@@ -5,44 +5,148 @@ This module handles the deployment of the CI/CD pipeline to AWS.
 """
 
 import click
-import json
-import subprocess
 import os
 from pathlib import Path
+from typing import Optional
 
 from ..utils.console import (
     print_success, print_error, print_info, print_warning, 
     print_step, print_header, confirm
 )
-from ..utils.aws_utils import (
-    check_aws_credentials, get_aws_account_info, check_cdk_installed,
-    get_cdk_version, check_cdk_bootstrap, bootstrap_cdk
-)
+from ..utils.config import load_config, get_config_path, ConfigNotFoundError, PipelineConfig
+from ..utils.file_utils import resolve_executable, write_bytes_atomic
+
+# Number of trailing output lines kept from streamed CDK commands
+OUTPUT_TAIL_LINES = 500
 
+# Seconds a timed-out CDK command gets to exit after SIGTERM before SIGKILL
+KILL_GRACE_PERIOD = 5
 
-def check_config_exists() -> bool:
-    """Check if pipeline configuration exists"""
-    config_path = Path.cwd() / ".pipeline" / "config.json"
-    return config_path.exists()
+# Files that must be present in the CDK directory before deploying
+REQUIRED_CDK_FILES = frozenset({'app.py', 'cdk.json'})
 
+# Directories in the CDK tree that do not affect what gets deployed
+DEPLOY_HASH_IGNORED_DIRS = frozenset({'.venv', 'cdk.out', '__pycache__', 'node_modules', '.git'})
 
-def load_config() -> dict:
-    """Load pipeline configuration"""
-    config_path = Path.cwd() / ".pipeline" / "config.json"
-    with open(config_path, 'r') as f:
-        return json.load(f)
+# Hash of the inputs of the last successful deploy
+LAST_DEPLOY_HASH_FILE = ".last-deploy-hash"
 
 
 def check_cdk_files_exist(cdk_dir: Path) -> bool:
     """Check if CDK files exist"""
-    required_files = ['app.py', 'cdk.json']
-    return all((cdk_dir / file).exists() for file in required_files)
+    try:
+        with os.scandir(cdk_dir) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return False
+    return REQUIRED_CDK_FILES.issubset(names)
+
+
+def compute_deploy_hash(cdk_dir: Path, config: PipelineConfig, account_id: str) -> str:
+    """
+    Hash the inputs of a deployment
+    
+    Covers the path, mtime and size of every file in the CDK tree (skipping
+    virtual environments and synth output), the configuration file's mtime
+    and size, and the target account, environment and region.
+    
+    Args:
+        cdk_dir: CDK directory path
+        config: Deploy settings
+        account_id: AWS account the deployment targets
+        
+    Returns:
+        Hex digest identifying the deployment inputs
+    """
+    import hashlib
+    
+    digest = hashlib.sha256()
+    pending = [cdk_dir]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in DEPLOY_HASH_IGNORED_DIRS:
+                        pending.append(entry.path)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    relpath = os.path.relpath(entry.path, cdk_dir)
+                    digest.update(f"{relpath}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    
+    config_stat = os.stat(get_config_path())
+    digest.update(f"config\0{config_stat.st_mtime_ns}\0{config_stat.st_size}\n".encode())
+    digest.update(f"target\0{account_id}\0{config.environment}\0{config.aws_region}\n".encode())
+    return digest.hexdigest()
+
+
+def _deploy_hash_or_none(cdk_dir: Path, config: PipelineConfig,
+                         account_info: Optional[dict]) -> Optional[str]:
+    """Compute the deploy hash, or None if the account or CDK tree is unknown"""
+    account_id = account_info.get('account_id') if account_info else None
+    if not account_id or not cdk_dir.is_dir():
+        return None
+    try:
+        return compute_deploy_hash(cdk_dir, config, account_id)
+    except OSError:
+        return None
+
+
+def _read_last_deploy_hash(path: Path) -> Optional[str]:
+    """Read the hash recorded by the last successful deploy, if any"""
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def _kill_process_group(proc) -> None:
+    """
+    Stop a command started in its own session, including its children
+    
+    The group is sent SIGTERM, then SIGKILL once KILL_GRACE_PERIOD has
+    passed. On Windows, where there is no process group, only the command
+    itself is terminated and then killed.
+    
+    Args:
+        proc: Process started with start_new_session on POSIX
+    """
+    import signal
+    import subprocess
+    
+    def _signal(sig, fallback):
+        if os.name == 'nt':
+            fallback()
+            return
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            pass
+        except OSError:
+            fallback()
+    
+    _signal(signal.SIGTERM, proc.terminate)
+    try:
+        proc.wait(timeout=KILL_GRACE_PERIOD)
+    except subprocess.TimeoutExpired:
+        pass
+    # Children may outlive the command itself, so the group is killed anyway
+    _signal(getattr(signal, 'SIGKILL', signal.SIGTERM), proc.kill)
+    proc.wait()
 
 
 def run_cdk_command(command: list[str], cwd: Path, timeout: int = 600) -> tuple[bool, str]:
     """
     Run CDK command and return success status and output
     
+    Output is passed through to the console as raw bytes while it is
+    produced. Only the last OUTPUT_TAIL_LINES lines are kept, and only those
+    are decoded for the returned output.
+    
+    The command runs in its own session. If it, or any child still holding
+    its output open, is running after the timeout, the whole process group
+    is stopped and the timeout is reported.
+    
     Args:
         command: CDK command as list of strings
         cwd: Working directory
@@ -51,56 +155,138 @@ def run_cdk_command(command: list[str], cwd: Path, timeout: int = 600) -> tuple[
     Returns:
         Tuple of (success, output/error_message)
     """
+    import subprocess
+    import sys
+    import threading
+    import time
+    from collections import deque
+    
     try:
-        result = subprocess.run(
-            command,
+        proc = subprocess.Popen(
+            [resolve_executable(command[0]), *command[1:]],
             cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=timeout
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=(os.name != 'nt')
         )
-        
-        if result.returncode == 0:
-            return True, result.stdout
-        else:
-            return False, result.stderr or result.stdout
-            
-    except subprocess.TimeoutExpired:
-        return False, f"Command timed out after {timeout} seconds"
     except Exception as e:
         return False, f"Error running command: {str(e)}"
+    
+    deadline = time.monotonic() + timeout
+    
+    # Console output so far goes through the text layer; flush it before
+    # writing bytes underneath it
+    sys.stdout.flush()
+    out = getattr(sys.stdout, 'buffer', None)
+    
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    errors = []
+    
+    def _pump():
+        # Runs until every process holding the pipe has closed it, so a
+        # lingering child can never block the caller
+        try:
+            for line in proc.stdout:
+                if out is not None:
+                    out.write(line)
+                    out.flush()
+                else:
+                    click.echo(line.decode('utf-8', errors='replace'), nl=False)
+                tail.append(line)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            proc.stdout.close()
+    
+    reader = threading.Thread(target=_pump, daemon=True)
+    reader.start()
+    
+    try:
+        proc.wait(timeout=timeout)
+        reader.join(max(deadline - time.monotonic(), 0))
+    except subprocess.TimeoutExpired:
+        pass
+    
+    if reader.is_alive():
+        _kill_process_group(proc)
+        reader.join(KILL_GRACE_PERIOD)
+        return False, f"Command timed out after {timeout} seconds and was stopped"
+    
+    if errors:
+        return False, f"Error running command: {str(errors[0])}"
+    
+    output = b"".join(tail).decode('utf-8', errors='replace').rstrip("\n")
+    return proc.returncode == 0, output
+
+
+def _requirements_hash(requirements_path: Path) -> str:
+    """Return the sha256 hex digest of a requirements file"""
+    import hashlib
+    return hashlib.sha256(requirements_path.read_bytes()).hexdigest()
 
 
 def install_cdk_dependencies(cdk_dir: Path) -> bool:
-    """Install CDK Python dependencies"""
+    """
+    Install CDK Python dependencies
+    
+    The sha256 of requirements.txt is recorded in the virtual environment
+    after a successful install, and the install is skipped while it matches.
+    uv is used for the virtual environment and install when it is on PATH,
+    otherwise venv and pip are used.
+    """
+    import subprocess
+    
     try:
         print_step("Installing CDK dependencies...")
         
-        # Check if virtual environment exists
         venv_path = cdk_dir / ".venv"
+        hash_path = venv_path / ".req-hash"
+        requirements_hash = _requirements_hash(cdk_dir / "requirements.txt")
+        
+        if hash_path.exists() and hash_path.read_text().strip() == requirements_hash:
+            print_success("Dependencies already up to date")
+            return True
+        
+        try:
+            uv = resolve_executable("uv")
+        except FileNotFoundError:
+            uv = None
+        
+        # Check if virtual environment exists
         if not venv_path.exists():
             print_info("Creating Python virtual environment...")
-            result = subprocess.run([
-                "python", "-m", "venv", str(venv_path)
-            ], cwd=cdk_dir, capture_output=True, text=True)
+            if uv:
+                # Seed pip so a later run without uv can still install
+                venv_cmd = [uv, "venv", "--seed", str(venv_path)]
+            else:
+                venv_cmd = [resolve_executable("python"), "-m", "venv", str(venv_path)]
+            result = subprocess.run(venv_cmd, cwd=cdk_dir, capture_output=True, text=True)
             
             if result.returncode != 0:
                 print_error(f"Failed to create virtual environment: {result.stderr}")
                 return False
         
-        # Determine pip path
+        # Determine interpreter and pip paths
         if os.name == 'nt':  # Windows
+            python_path = venv_path / "Scripts" / "python.exe"
             pip_path = venv_path / "Scripts" / "pip"
         else:  # Unix/Linux/macOS
+            python_path = venv_path / "bin" / "python"
             pip_path = venv_path / "bin" / "pip"
         
+        if uv:
+            install_cmd = [uv, "pip", "install", "--python", str(python_path), "-r", "requirements.txt"]
+        else:
+            install_cmd = [str(pip_path), "install", "-r", "requirements.txt"]
+        
         # Install dependencies
         print_step("Installing Python packages...")
-        result = subprocess.run([
-            str(pip_path), "install", "-r", "requirements.txt"
-        ], cwd=cdk_dir, capture_output=True, text=True, timeout=180)
+        result = subprocess.run(
+            install_cmd, cwd=cdk_dir, capture_output=True, text=True, timeout=180
+        )
         
         if result.returncode == 0:
+            hash_path.write_text(requirements_hash)
             print_success("Dependencies installed successfully")
             return True
         else:
@@ -117,7 +303,8 @@ def install_cdk_dependencies(cdk_dir: Path) -> bool:
 @click.option('--region', '-r', help='AWS region (overrides config)')
 @click.option('--auto-approve', '-y', is_flag=True, help='Skip confirmation prompts')
 @click.option('--cdk-dir', default='./cdk', help='CDK directory path')
-def deploy_command(environment: str, region: str, auto_approve: bool, cdk_dir: str):
+@click.option('--force', '-f', is_flag=True, help='Deploy even if nothing changed since the last deploy')
+def deploy_command(environment: str, region: str, auto_approve: bool, cdk_dir: str, force: bool):
     """
     Deploy the CI/CD pipeline to AWS using CDK.
     
@@ -129,58 +316,83 @@ def deploy_command(environment: str, region: str, auto_approve: bool, cdk_dir: s
         pipeline deploy -e prod            # Deploy to production environment
         pipeline deploy -r us-west-2       # Deploy to specific region
         pipeline deploy -y                 # Skip confirmation prompts
+        pipeline deploy -f                 # Deploy even if nothing changed
     """
-    print_header("Deploy Pipeline to AWS")
+    from ..utils.aws_utils import (
+        check_aws_credentials, get_aws_account_info, check_cdk_installed,
+        get_cdk_version, check_cdk_bootstrap, bootstrap_cdk
+    )
     
-    # Check if configuration exists
-    if not check_config_exists():
-        print_error("❌ No pipeline configuration found!")
-        print_info("Run 'pipeline init' first to initialize your pipeline configuration.")
-        return
+    print_header("Deploy Pipeline to AWS")
     
     # Load configuration
     print_step("Loading configuration...")
     try:
-        config = load_config()
-        
         # Override config values if provided
-        deploy_env = environment or config['environment']
-        deploy_region = region or config['aws_region']
+        config = PipelineConfig.from_dict(load_config(), environment=environment, region=region)
         
-        print_info(f"📦 Project: {config['project_name']}")
-        print_info(f"🌍 Environment: {deploy_env}")
-        print_info(f"🗺️ Region: {deploy_region}")
+        print_info(f"📦 Project: {config.project_name}")
+        print_info(f"🌍 Environment: {config.environment}")
+        print_info(f"🗺️ Region: {config.aws_region}")
+    except ConfigNotFoundError:
+        print_error("❌ No pipeline configuration found!")
+        print_info("Run 'pipeline init' first to initialize your pipeline configuration.")
+        return
     except Exception as e:
         print_error(f"Error loading configuration: {str(e)}")
         return
     
+    # Run the independent AWS and CDK preflight checks concurrently; results
+    # are consumed below in the original order so output stays the same
+    from concurrent.futures import ThreadPoolExecutor
+    
+    executor = ThreadPoolExecutor(max_workers=5)
+    preflight = {
+        'credentials': executor.submit(check_aws_credentials),
+        'account_info': executor.submit(get_aws_account_info),
+        'cdk_installed': executor.submit(check_cdk_installed),
+        'cdk_version': executor.submit(get_cdk_version),
+        'bootstrap': executor.submit(check_cdk_bootstrap, config.aws_region),
+    }
+    executor.shutdown(wait=False)
+    
     # Check AWS credentials
     print_step("Validating AWS credentials...")
-    if not check_aws_credentials():
+    if not preflight['credentials'].result():
         print_error("❌ AWS credentials not configured!")
         print_info("Please configure your AWS credentials:")
         print_info("  1. aws configure")
         print_info("  2. Or set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables")
         return
     
-    account_info = get_aws_account_info()
+    account_info = preflight['account_info'].result()
     if account_info:
         print_success(f"✅ AWS Account: {account_info['account_id']}")
     
+    # Skip the deployment when nothing changed since the last successful one
+    # to the same account; without a known account, always deploy
+    cdk_path = Path(cdk_dir)
+    last_hash_path = get_config_path().parent / LAST_DEPLOY_HASH_FILE
+    deploy_hash = _deploy_hash_or_none(cdk_path, config, account_info)
+    
+    if not force and deploy_hash and _read_last_deploy_hash(last_hash_path) == deploy_hash:
+        print_success("✅ No changes since last deploy")
+        print_info("Use 'pipeline deploy --force' to deploy anyway.")
+        return
+    
     # Check CDK CLI
     print_step("Checking CDK installation...")
-    if not check_cdk_installed():
+    if not preflight['cdk_installed'].result():
         print_error("❌ AWS CDK CLI is not installed!")
         print_info("Please install CDK CLI:")
         print_info("  npm install -g aws-cdk")
         return
     
-    cdk_version = get_cdk_version()
+    cdk_version = preflight['cdk_version'].result()
     if cdk_version:
         print_success(f"✅ CDK CLI: {cdk_version}")
     
     # Check CDK files
-    cdk_path = Path(cdk_dir)
     print_step("Checking CDK files...")
     if not cdk_path.exists():
         print_error(f"❌ CDK directory '{cdk_dir}' not found!")
@@ -201,20 +413,20 @@ def deploy_command(environment: str, region: str, auto_approve: bool, cdk_dir: s
     
     # Check CDK bootstrap status
     print_step("Checking CDK bootstrap status...")
-    is_bootstrapped, bootstrap_error = check_cdk_bootstrap(deploy_region)
+    is_bootstrapped, bootstrap_error = preflight['bootstrap'].result()
     
     if not is_bootstrapped:
-        print_warning(f"⚠️ CDK not bootstrapped in region {deploy_region}")
+        print_warning(f"⚠️ CDK not bootstrapped in region {config.aws_region}")
         print_info(bootstrap_error or "CDK bootstrap is required for deployment")
         
         if not auto_approve:
             if not confirm("Do you want to bootstrap CDK now?"):
                 print_info("Deployment cancelled. Please bootstrap CDK manually:")
-                print_info(f"  cdk bootstrap aws://unknown-account/{deploy_region}")
+                print_info(f"  cdk bootstrap aws://unknown-account/{config.aws_region}")
                 return
         
         print_step("Bootstrapping CDK...")
-        success, error = bootstrap_cdk(deploy_region)
+        success, error = bootstrap_cdk(config.aws_region)
         if not success:
             print_error(f"❌ CDK bootstrap failed: {error}")
             return
@@ -227,9 +439,9 @@ def deploy_command(environment: str, region: str, auto_approve: bool, cdk_dir: s
     if not auto_approve:
         print_info("")
         print_info("🚀 Ready to deploy pipeline infrastructure:")
-        print_info(f"   Project: {config['project_name']}")
-        print_info(f"   Environment: {deploy_env}")
-        print_info(f"   Region: {deploy_region}")
+        print_info(f"   Project: {config.project_name}")
+        print_info(f"   Environment: {config.environment}")
+        print_info(f"   Region: {config.aws_region}")
         print_info("")
         
         if not confirm("Proceed with deployment?"):
@@ -238,10 +450,8 @@ def deploy_command(environment: str, region: str, auto_approve: bool, cdk_dir: s
     
     # CDK diff (show changes)
     print_step("Checking deployment changes...")
-    success, diff_output = run_cdk_command(['cdk', 'diff'], cdk_path, timeout=120)
-    if success and diff_output.strip():
-        print_info("📋 Infrastructure changes:")
-        print_info(diff_output[:1000] + "..." if len(diff_output) > 1000 else diff_output)
+    print_info("📋 Infrastructure changes:")
+    run_cdk_command(['cdk', 'diff'], cdk_path, timeout=120)
     
     # Deploy CDK stack
     print_step("Deploying CDK stack...")
@@ -254,6 +464,12 @@ def deploy_command(environment: str, region: str, auto_approve: bool, cdk_dir: s
     success, deploy_output = run_cdk_command(deploy_cmd, cdk_path, timeout=1800)  # 30 minutes
     
     if success:
+        if deploy_hash:
+            try:
+                write_bytes_atomic(last_hash_path, deploy_hash.encode())
+            except OSError as e:
+                print_warning(f"Could not record deploy hash: {str(e)}")
+        
         print_success("✅ Pipeline deployed successfully!")
         print_info("")
         print_info("🎉 Your CI/CD pipeline is now active!")
@@ -271,51 +487,10 @@ def deploy_command(environment: str, region: str, auto_approve: bool, cdk_dir: s
     else:
         print_error("❌ Deployment failed!")
         print_error("Error details:")
-        print_error(deploy_output[:1000] if deploy_output else "Unknown error")
+        print_error(deploy_output[-1000:] if deploy_output else "Unknown error")
         print_info("")
         print_info("💡 Troubleshooting tips:")
         print_info("  • Check AWS credentials and permissions")
         print_info("  • Verify CDK bootstrap in the target region")
         print_info("  • Review error messages above")
-        print_info("  • Check AWS CloudFormation console for more details")
-        print_error("No pipeline configuration found!")
-        print_info("Run 'pipeline init' first to initialize the configuration.")
-        return
-    
-    print_step("Loading configuration...")
-    config = load_config()
-    
-    project_name = config.get('project_name', 'my-pipeline')
-    deploy_env = environment or config.get('environment', 'dev')
-    deploy_region = region or config.get('aws_region', 'us-east-1')
-    
-    print_info(f"📦 Project: {project_name}")
-    print_info(f"🌍 Environment: {deploy_env}")
-    print_info(f"🗺️ Region: {deploy_region}")
-    
-    # For MVP, show what would be deployed
-    print_step("Validating AWS credentials...")
-    print_step("Checking CDK bootstrap status...")
-    print_step("Planning deployment...")
-    
-    print_warning("🚧 Deployment is coming soon!")
-    print_info("This command will deploy:")
-    print_info("  • CodePipeline for CI/CD")
-    print_info("  • CodeBuild project for builds")
-    print_info("  • S3 bucket for artifacts")
-    print_info("  • IAM roles and policies")
-    print_info("  • CloudWatch logs and monitoring")
-    
-    print_info("\nFor now, you can manually deploy with:")
-    print_info("  1. Ensure AWS CDK is installed: npm install -g aws-cdk")
-    print_info("  2. Bootstrap CDK: cdk bootstrap")
-    print_info("  3. Deploy stack: cdk deploy")
-    
-    print_success("Deployment planning completed!")
-    print_info("Full deployment will be available in the next version.")
-    
-    # Show next steps
-    print_info("\nRecommended next steps:")
-    print_info("  • Review generated CDK code")
-    print_info("  • Test the pipeline with a sample commit")
-    print_info("  • Configure notifications and monitoring")
\ No newline at end of file
+        print_info("  • Check AWS CloudFormation console for more details")
\ No newline at end of file
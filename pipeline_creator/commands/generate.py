@@ -5,82 +5,150 @@ This module handles the generation of CDK infrastructure files.
 """
 
 import click
-import json
+import functools
 import os
 import re
+import string
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..utils.console import (
     print_success, print_error, print_info, print_warning, 
     print_step, print_header
 )
-from ..utils.aws_utils import check_aws_credentials, get_aws_account_info
-from ..templates.cdk_python import (
-    CDK_APP_TEMPLATE, PIPELINE_STACK_TEMPLATE, CDK_JSON_TEMPLATE,
-    REQUIREMENTS_TEMPLATE, README_TEMPLATE
-)
-from ..templates.stages.extra_stages import get_stage_template
+from ..utils.config import load_config, ConfigNotFoundError
+
+
+# Patterns used by the case conversion helpers
+_SNAKE_WORD_RE = re.compile(r'(.)([A-Z][a-z]+)')
+_SNAKE_BOUNDARY_RE = re.compile(r'([a-z0-9])([A-Z])')
+_WORD_SPLIT_RE = re.compile(r'[-_\s]+')
 
+# Owner and repository of SSH (git@github.com:owner/repo.git) and HTTPS
+# (https://github.com/owner/repo.git) GitHub remote URLs
+_GITHUB_URL_RE = re.compile(r'(?:^git@github\.com:|github\.com/)([^/]+)/([^/]+?)(?:\.git)?(?:/|$)')
 
-def check_config_exists() -> bool:
-    """Check if pipeline configuration exists"""
-    config_path = Path.cwd() / ".pipeline" / "config.json"
-    return config_path.exists()
 
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_LOWER_OR_DIGIT = _ASCII_LOWER | frozenset(string.digits)
 
-def load_config() -> dict:
-    """Load pipeline configuration"""
-    config_path = Path.cwd() / ".pipeline" / "config.json"
-    with open(config_path, 'r') as f:
-        return json.load(f)
 
+def _to_snake_case_regex(name: str) -> str:
+    """Convert a hyphen-free string to snake_case using the regex patterns"""
+    name = _SNAKE_WORD_RE.sub(r'\1_\2', name)
+    return _SNAKE_BOUNDARY_RE.sub(r'\1_\2', name).lower()
 
+
+@functools.lru_cache(maxsize=256)
 def to_snake_case(name: str) -> str:
     """Convert string to snake_case"""
     # Replace hyphens with underscores first
     name = name.replace('-', '_')
-    name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+    
+    # '.' in the word pattern does not match newlines, so leave those to it
+    if '\n' in name:
+        return _to_snake_case_regex(name)
+    
+    # Single pass equivalent of the two patterns: an ASCII capital gets an
+    # underscore before it when it follows a lowercase letter or digit, or
+    # when it starts a capitalized word
+    out = []
+    last = len(name) - 1
+    for i, char in enumerate(name):
+        if i and char in _ASCII_UPPER and (
+            name[i - 1] in _ASCII_LOWER_OR_DIGIT
+            or (i < last and name[i + 1] in _ASCII_LOWER)
+        ):
+            out.append('_')
+        out.append(char)
+    return ''.join(out).lower()
 
 
+@functools.lru_cache(maxsize=256)
 def to_pascal_case(name: str) -> str:
     """Convert string to PascalCase"""
-    return ''.join(word.capitalize() for word in re.split(r'[-_\s]+', name))
+    return ''.join(word.capitalize() for word in _WORD_SPLIT_RE.split(name))
+
+
+@functools.lru_cache(maxsize=64)
+def _placeholder_pattern(keys: tuple) -> "re.Pattern":
+    """Compile a pattern matching any of the {key} placeholders"""
+    return re.compile('|'.join(re.escape(f"{{{key}}}") for key in keys))
+
+
+def fill_placeholders(commands: list, values: Dict[str, Any]) -> list:
+    """
+    Replace {key} placeholders in commands with configured values
+    
+    Args:
+        commands: Command strings possibly containing placeholders
+        values: Placeholder values by key
+        
+    Returns:
+        List of commands with placeholders replaced
+    """
+    if not values:
+        return list(commands)
+    
+    replacements = {f"{{{key}}}": str(value) for key, value in values.items()}
+    pattern = _placeholder_pattern(tuple(values))
+    return [pattern.sub(lambda match: replacements[match.group(0)], command) for command in commands]
 
 
-def process_extra_stages(config: Dict[str, Any]) -> Dict[str, list]:
+def resolve_stages(config: Dict[str, Any]) -> List[Tuple[Dict[str, Any], dict]]:
+    """
+    Pair each enabled extra stage with its template
+    
+    Stages that are disabled or have no known template are skipped.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Returns:
+        List of (stage_config, stage_template) tuples
+    """
+    extra_stages = config.get("extra_stages")
+    if not extra_stages:
+        return []
+    
+    from ..templates.stages.extra_stages import get_stage_template
+    
+    resolved = []
+    for stage_config in extra_stages:
+        if not stage_config.get("enabled", True):
+            continue
+        
+        stage_template = get_stage_template(stage_config.get("name"))
+        if stage_template:
+            resolved.append((stage_config, stage_template))
+    
+    return resolved
+
+
+def process_extra_stages(config: Dict[str, Any],
+                         stages: Optional[List[Tuple[Dict[str, Any], dict]]] = None) -> Dict[str, list]:
     """Process extra stages and return commands by phase"""
+    if stages is None:
+        stages = resolve_stages(config)
+    
+    # Nothing to process; callers extend the lists, so build a fresh dict
+    if not stages:
+        return {"pre_build": [], "build": [], "post_build": []}
+    
     stages_by_phase = {
         "pre_build": [],
         "build": [],
         "post_build": []
     }
     
-    extra_stages = config.get("extra_stages", [])
-    
-    for stage_config in extra_stages:
-        if not stage_config.get("enabled", True):
-            continue
-            
+    for stage_config, stage_template in stages:
         stage_name = stage_config.get("name")
-        stage_template = get_stage_template(stage_name)
-        
-        if not stage_template:
-            continue
-            
         phase = stage_config.get("phase", stage_template.get("phase", "build"))
         commands = stage_template.get("commands", [])
         
         # Replace placeholders in commands with actual config values
-        stage_specific_config = stage_config.get("config", {})
-        processed_commands = []
-        
-        for command in commands:
-            processed_command = command
-            for key, value in stage_specific_config.items():
-                processed_command = processed_command.replace(f"{{{key}}}", str(value))
-            processed_commands.append(processed_command)
+        processed_commands = fill_placeholders(commands, stage_config.get("config", {}))
         
         # Add stage commands to the appropriate phase
         if phase in stages_by_phase:
@@ -91,52 +159,75 @@ def process_extra_stages(config: Dict[str, Any]) -> Dict[str, list]:
     return stages_by_phase
 
 
-def get_environment_variables(config: Dict[str, Any]) -> list:
+def get_environment_variables(config: Dict[str, Any],
+                              stages: Optional[List[Tuple[Dict[str, Any], dict]]] = None) -> list:
     """Get environment variables for all extra stages"""
+    if stages is None:
+        stages = resolve_stages(config)
+    
+    if not stages:
+        return []
+    
     env_vars = []
-    extra_stages = config.get("extra_stages", [])
+    for _, stage_template in stages:
+        env_vars.extend(stage_template.get("environment_variables", []))
     
-    for stage_config in extra_stages:
-        if not stage_config.get("enabled", True):
-            continue
-            
-        stage_name = stage_config.get("name")
-        stage_template = get_stage_template(stage_name)
+    return env_vars
+
+
+def read_origin_url(cwd: str) -> Optional[str]:
+    """
+    Read the origin remote URL straight from .git/config
+    
+    Args:
+        cwd: Repository root directory
         
-        if not stage_template:
-            continue
-            
-        stage_env_vars = stage_template.get("environment_variables", [])
-        env_vars.extend(stage_env_vars)
+    Returns:
+        The URL, or None if it cannot be read this way (no .git directory,
+        worktrees, unparsable config) and git itself should be asked
+    """
+    import configparser
     
-    return env_vars
+    git_config = os.path.join(cwd, '.git', 'config')
+    if not os.path.isfile(git_config):
+        return None
+    
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        parser.read(git_config, encoding='utf-8')
+    except (configparser.Error, UnicodeDecodeError):
+        return None
+    
+    url = parser.get('remote "origin"', 'url', fallback=None)
+    return url.strip() if url else None
 
 
 def detect_repository_info(config: Dict[str, Any]) -> tuple[str, str]:
     """
     Detect repository owner and name from git or config
     """
-    project_name = config.get('project_name', 'my-project')
-    
+    return _detect_repository_info(config.get('project_name', 'my-project'), os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_repository_info(project_name: str, cwd: str) -> tuple[str, str]:
+    """
+    Detect repository owner and name, memoized per project name and directory
+    """
     # Try to get from git remote
     try:
-        import subprocess
-        result = subprocess.run(['git', 'remote', 'get-url', 'origin'], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            url = result.stdout.strip()
-            if 'github.com' in url:
-                # Extract owner/repo from GitHub URL
-                if url.startswith('git@github.com:'):
-                    path = url.replace('git@github.com:', '').replace('.git', '')
-                elif 'github.com/' in url:
-                    path = url.split('github.com/')[-1].replace('.git', '')
-                else:
-                    return "your-username", project_name
-                
-                parts = path.split('/')
-                if len(parts) >= 2:
-                    return parts[0], parts[1]
+        url = read_origin_url(cwd)
+        if url is None:
+            import subprocess
+            result = subprocess.run(['git', 'remote', 'get-url', 'origin'], 
+                                  capture_output=True, text=True, timeout=5, cwd=cwd)
+            if result.returncode == 0:
+                url = result.stdout.strip()
+        
+        # Extract owner/repo from GitHub URL
+        match = _GITHUB_URL_RE.search(url) if url else None
+        if match:
+            return match.group(1), match.group(2)
     except Exception:
         pass
     
@@ -145,6 +236,9 @@ def detect_repository_info(config: Dict[str, Any]) -> tuple[str, str]:
 
 def create_cdk_files(config: Dict[str, Any], output_dir: Path, language: str = 'python') -> bool:
     """Create CDK files based on configuration"""
+    from ..templates.cdk_python import (
+        CDK_APP, PIPELINE_STACK, CDK_JSON_BYTES, REQUIREMENTS_BYTES, README
+    )
     
     try:
         print_step("Creating CDK directory structure...")
@@ -162,8 +256,9 @@ def create_cdk_files(config: Dict[str, Any], output_dir: Path, language: str = '
         
         # Process extra stages
         print_step("Processing extra stages...")
-        extra_stage_commands = process_extra_stages(config)
-        env_vars = get_environment_variables(config)
+        stages = resolve_stages(config)
+        extra_stage_commands = process_extra_stages(config, stages)
+        env_vars = get_environment_variables(config, stages)
         
         # Combine original commands with extra stage commands
         pre_build_commands = (config['pipeline']['build_spec']['commands']['pre_build'] + 
@@ -173,7 +268,8 @@ def create_cdk_files(config: Dict[str, Any], output_dir: Path, language: str = '
         post_build_commands = (config['pipeline']['build_spec']['commands']['post_build'] + 
                               extra_stage_commands['post_build'])
         
-        # Prepare template variables
+        # Prepare template variables; lists and dicts are rendered with repr()
+        # since the stack template is Python source, not JSON
         template_vars = {
             'project_name': config['project_name'],
             'project_name_snake': project_name_snake,
@@ -182,36 +278,35 @@ def create_cdk_files(config: Dict[str, Any], output_dir: Path, language: str = '
             'environment': config['environment'],
             'repo_owner': repo_owner,
             'repo_name': repo_name,
-            'pre_build_commands': json.dumps(pre_build_commands),
-            'build_commands': json.dumps(build_commands),
-            'post_build_commands': json.dumps(post_build_commands),
-            'artifact_files': json.dumps(config['pipeline']['artifacts']['files']),
-            'environment_variables': json.dumps(env_vars)
+            'pre_build_commands': repr(pre_build_commands),
+            'build_commands': repr(build_commands),
+            'post_build_commands': repr(post_build_commands),
+            'artifact_files': repr(config['pipeline']['artifacts']['files']),
+            'environment_variables': repr(env_vars)
         }
         
         if language == 'python':
             print_step("Generating Python CDK files...")
             
-            # Create app.py
-            app_content = CDK_APP_TEMPLATE.format(**template_vars)
-            (output_dir / "app.py").write_text(app_content)
-            
-            # Create pipeline stack
-            stack_content = PIPELINE_STACK_TEMPLATE.format(**template_vars)
             stack_dir = output_dir / project_name_snake
-            (stack_dir / "__init__.py").write_text("")
-            (stack_dir / "pipeline_stack.py").write_text(stack_content)
             
-            # Create cdk.json
-            cdk_json_content = CDK_JSON_TEMPLATE
-            (output_dir / "cdk.json").write_text(cdk_json_content)
+            # Render and encode every file first, then write them
+            files = [
+                (output_dir / "app.py", CDK_APP.render(template_vars).encode('utf-8')),
+                (stack_dir / "__init__.py", b""),
+                (stack_dir / "pipeline_stack.py", PIPELINE_STACK.render(template_vars).encode('utf-8')),
+                (output_dir / "cdk.json", CDK_JSON_BYTES),
+                (output_dir / "requirements.txt", REQUIREMENTS_BYTES),
+                (output_dir / "README.md", README.render(template_vars).encode('utf-8')),
+            ]
             
-            # Create requirements.txt
-            (output_dir / "requirements.txt").write_text(REQUIREMENTS_TEMPLATE)
+            # The writes are independent, so overlap them
+            from concurrent.futures import ThreadPoolExecutor
             
-            # Create README.md
-            readme_content = README_TEMPLATE.format(**template_vars)
-            (output_dir / "README.md").write_text(readme_content)
+            with ThreadPoolExecutor(max_workers=len(files)) as executor:
+                list(executor.map(
+                    lambda item: item[0].write_bytes(item[1]), files
+                ))
             
             print_success(f"Generated Python CDK files in {output_dir}")
             return True
@@ -243,13 +338,9 @@ def generate_command(output_dir: str, language: str, force: bool):
         pipeline generate -o ./infra        # Custom output directory
         pipeline generate --force           # Overwrite existing files
     """
-    print_header("Generate CDK Infrastructure")
+    from ..utils.aws_utils import check_aws_credentials, get_aws_account_info
     
-    # Check if configuration exists
-    if not check_config_exists():
-        print_error("❌ No pipeline configuration found!")
-        print_info("Run 'pipeline init' first to initialize your pipeline configuration.")
-        return
+    print_header("Generate CDK Infrastructure")
     
     # Load configuration
     print_step("Loading configuration...")
@@ -258,6 +349,10 @@ def generate_command(output_dir: str, language: str, force: bool):
         print_info(f"📦 Project: {config['project_name']}")
         print_info(f"🔧 Language: {language}")
         print_info(f"📁 Output: {output_dir}")
+    except ConfigNotFoundError:
+        print_error("❌ No pipeline configuration found!")
+        print_info("Run 'pipeline init' first to initialize your pipeline configuration.")
+        return
     except Exception as e:
         print_error(f"Error loading configuration: {str(e)}")
         return
@@ -305,36 +400,4 @@ def generate_command(output_dir: str, language: str, force: bool):
         print_info("  5. pipeline deploy")
         
     else:
-        print_error("❌ Failed to generate CDK infrastructure files")
-        return
-        print_error("No pipeline configuration found!")
-        print_info("Run 'pipeline init' first to initialize the configuration.")
-        return
-    
-    print_step("Loading configuration...")
-    config = load_config()
-    project_name = config.get('project_name', 'my-pipeline')
-    
-    print_info(f"📦 Project: {project_name}")
-    print_info(f"🔧 Language: {language}")
-    print_info(f"📁 Output: {output_dir}")
-    
-    # For MVP, just show what would be generated
-    print_step("Analyzing configuration...")
-    print_step("Planning infrastructure resources...")
-    
-    print_warning("🚧 CDK generation is coming soon!")
-    print_info("This command will generate:")
-    print_info("  • CDK app with pipeline stack")
-    print_info("  • CodePipeline configuration")
-    print_info("  • CodeBuild project")  
-    print_info("  • IAM roles and policies")
-    print_info("  • S3 bucket for artifacts")
-    
-    print_info("\nFor now, you can manually set up CDK with:")
-    print_info(f"  1. cdk init app --language {language}")
-    print_info("  2. Add pipeline resources to your stack")
-    print_info("  3. Run 'cdk deploy'")
-    
-    print_success("Infrastructure planning completed!")
-    print_info("Full CDK generation will be available in the next version.")
\ No newline at end of file
+        print_error("❌ Failed to generate CDK infrastructure files")
\ No newline at end of file
@@ -6,15 +6,15 @@ Creates the .pipeline directory and config.json with default settings.
 """
 
 import click
-import json
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
 
 from ..utils.console import (
     print_success, print_error, print_info, print_warning, 
     print_step, print_header, confirm
 )
+from ..utils.config import save_config
 
 
 def get_default_config() -> Dict[str, Any]:
@@ -71,14 +71,37 @@ def get_default_config() -> Dict[str, Any]:
     }
 
 
-def validate_project_directory() -> bool:
+def list_directory(path: Path) -> Set[str]:
+    """
+    List the entry names of a directory with a single scan
+    
+    Args:
+        path: Directory to list
+    
+    Returns:
+        Set of entry names, empty if the directory cannot be read
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def validate_project_directory(cwd: Optional[Path] = None,
+                               present: Optional[Set[str]] = None) -> bool:
     """
     Validate that current directory is suitable for pipeline initialization
     
+    Args:
+        cwd: Directory to validate, defaults to the current directory
+        present: Entry names of the directory, listed if not given
+    
     Returns:
         True if valid, False otherwise
     """
-    current_dir = Path.cwd()
+    if present is None:
+        present = list_directory(cwd or Path.cwd())
     
     # Check if it looks like a project directory
     common_files = [
@@ -86,7 +109,7 @@ def validate_project_directory() -> bool:
         "README.md", ".git", "src", "app"
     ]
     
-    has_project_files = any((current_dir / file).exists() for file in common_files)
+    has_project_files = any(file in present for file in common_files)
     
     if not has_project_files:
         print_warning("This doesn't appear to be a project directory.")
@@ -96,53 +119,50 @@ def validate_project_directory() -> bool:
     return True
 
 
-def detect_project_type() -> str:
+def detect_project_type(cwd: Optional[Path] = None,
+                        present: Optional[Set[str]] = None) -> str:
     """
     Try to detect the project type based on files present
     
+    Args:
+        cwd: Project directory, defaults to the current directory
+        present: Entry names of the directory, listed if not given
+    
     Returns:
         Detected project type
     """
-    current_dir = Path.cwd()
+    if present is None:
+        present = list_directory(cwd or Path.cwd())
     
-    if (current_dir / "package.json").exists():
+    if "package.json" in present:
         return "node"
-    elif (current_dir / "requirements.txt").exists() or (current_dir / "setup.py").exists():
+    elif "requirements.txt" in present or "setup.py" in present:
         return "python"
-    elif (current_dir / "go.mod").exists():
+    elif "go.mod" in present:
         return "go"
-    elif (current_dir / "pom.xml").exists():
+    elif "pom.xml" in present:
         return "java"
-    elif (current_dir / "Dockerfile").exists():
+    elif "Dockerfile" in present:
         return "docker"
     else:
         return "generic"
 
 
-def create_pipeline_directory() -> Path:
+def create_pipeline_directory(cwd: Optional[Path] = None) -> Path:
     """
     Create .pipeline directory if it doesn't exist
     
+    Args:
+        cwd: Project directory, defaults to the current directory
+    
     Returns:
         Path to .pipeline directory
     """
-    pipeline_dir = Path.cwd() / ".pipeline"
+    pipeline_dir = (cwd or Path.cwd()) / ".pipeline"
     pipeline_dir.mkdir(exist_ok=True)
     return pipeline_dir
 
 
-def save_config(config: Dict[str, Any], config_path: Path) -> None:
-    """
-    Save configuration to JSON file
-    
-    Args:
-        config: Configuration dictionary
-        config_path: Path to save configuration
-    """
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
-
-
 @click.command()
 @click.option('--project-name', '-n', help='Name of the project')
 @click.option('--region', '-r', default='us-east-1', help='AWS region')
@@ -162,13 +182,16 @@ def init_command(project_name: str, region: str, environment: str, force: bool):
     """
     print_header("Pipeline Initialization")
     
+    cwd = Path.cwd()
+    present = list_directory(cwd)
+    
     # Validate current directory
-    if not validate_project_directory():
+    if not validate_project_directory(cwd, present):
         print_error("Initialization cancelled.")
         return
     
     # Check if .pipeline directory already exists
-    pipeline_dir = Path.cwd() / ".pipeline"
+    pipeline_dir = cwd / ".pipeline"
     config_path = pipeline_dir / "config.json"
     
     if config_path.exists() and not force:
@@ -184,12 +207,12 @@ def init_command(project_name: str, region: str, environment: str, force: bool):
     config = get_default_config()
     
     # Detect project type
-    detected_type = detect_project_type()
+    detected_type = detect_project_type(cwd, present)
     print_info(f"Detected project type: {detected_type}")
     
     # Get project name
     if not project_name:
-        current_dir_name = Path.cwd().name
+        current_dir_name = cwd.name
         project_name = click.prompt(
             "Project name", 
             default=current_dir_name,
@@ -203,21 +226,23 @@ def init_command(project_name: str, region: str, environment: str, force: bool):
     config["pipeline"]["detected_type"] = detected_type
     
     print_step("Creating pipeline directory...")
-    create_pipeline_directory()
+    create_pipeline_directory(cwd)
     
     print_step("Saving configuration...")
-    save_config(config, config_path)
+    if not save_config(config, str(config_path)):
+        return
     
     # Create .gitignore entry if needed
-    gitignore_path = Path.cwd() / ".gitignore"
-    if gitignore_path.exists():
-        with open(gitignore_path, 'r') as f:
-            gitignore_content = f.read()
-        
-        if ".pipeline/" not in gitignore_content:
-            print_step("Adding .pipeline/ to .gitignore...")
-            with open(gitignore_path, 'a') as f:
-                f.write("\n# Pipeline Creator\n.pipeline/\n")
+    gitignore_path = cwd / ".gitignore"
+    try:
+        gitignore_content = gitignore_path.read_bytes()
+    except FileNotFoundError:
+        gitignore_content = None
+    
+    if gitignore_content is not None and b".pipeline/" not in gitignore_content:
+        print_step("Adding .pipeline/ to .gitignore...")
+        with open(gitignore_path, 'ab') as f:
+            f.write(b"\n# Pipeline Creator\n.pipeline/\n")
     
     print_success("Pipeline configuration initialized successfully!")
     print_info(f"📁 Configuration saved to: {config_path}")
@@ -4,14 +4,32 @@ Notifications Command - Configure pipeline notifications
 
 import click
 import json
-from typing import Dict, Any, Optional
+import os
+import re
+from typing import Dict, Any, List, Optional
 
 from ..utils.console import (
-    print_success, print_error, print_info, print_warning, 
-    print_header, print_step
+    print_success, print_error, print_info, print_info_lines, print_warning, 
+    print_header, print_step, prompt_form
 )
-from ..utils.config import load_config, save_config, check_config_exists
-from ..notifications.notification_service import NotificationService
+from ..utils.config import load_config, save_config, ConfigNotFoundError
+
+# Channels configured by "all"
+_ALL_CHANNELS = ("slack", "email", "webhook")
+
+# Loose sanity checks for comma-separated recipient and webhook lists
+_EMAIL_RE = re.compile(r"[^@\s,]+@[^@\s,]+\.[^@\s,]+")
+_URL_RE = re.compile(r"https?://[^\s,]+")
+
+# Sample event context sent by "notifications test"
+_TEST_CONTEXT = {
+    "project": "test-project",
+    "branch": "main",
+    "commit": "abc123def456",
+    "author": "Test User",
+    "duration": "2m 30s",
+    "environment": "staging"
+}
 
 
 @click.group(name="notifications")
@@ -45,12 +63,6 @@ def setup_command(channel: Optional[str], interactive: bool):
     """
     print_header("Setup Pipeline Notifications")
     
-    # Check if configuration exists
-    if not check_config_exists():
-        print_error("❌ No pipeline configuration found!")
-        print_info("Run 'pipeline init' first to initialize your pipeline configuration.")
-        return
-    
     try:
         # Load current configuration
         config = load_config()
@@ -61,7 +73,7 @@ def setup_command(channel: Optional[str], interactive: bool):
         
         # Determine which channels to configure
         if channel == "all" or not channel:
-            channels_to_setup = ["slack", "email", "webhook"]
+            channels_to_setup = _ALL_CHANNELS
         else:
             channels_to_setup = [channel]
         
@@ -95,6 +107,9 @@ def setup_command(channel: Optional[str], interactive: bool):
         print_step("Final notification configuration:")
         _display_current_config(updated_config)
         
+    except ConfigNotFoundError:
+        print_error("❌ No pipeline configuration found!")
+        print_info("Run 'pipeline init' first to initialize your pipeline configuration.")
     except Exception as e:
         print_error(f"Error setting up notifications: {str(e)}")
 
@@ -116,27 +131,15 @@ def test_command(channel: str):
     """
     print_header("Test Notification Channels")
     
-    if not check_config_exists():
-        print_error("❌ No pipeline configuration found!")
-        return
-    
     try:
+        load_config()
+        
         import asyncio
         from ..notifications.notification_service import NotificationService, NotificationEventType, NotificationPriority
         
         # Initialize notification service
         service = NotificationService()
         
-        # Test context
-        test_context = {
-            "project": "test-project",
-            "branch": "main",
-            "commit": "abc123def456",
-            "author": "Test User",
-            "duration": "2m 30s",
-            "environment": "staging"
-        }
-        
         # Determine channels to test
         if channel == "all":
             channels_to_test = None  # Test all configured channels
@@ -145,15 +148,17 @@ def test_command(channel: str):
         
         print_step("Sending test notifications...")
         
-        # Send test notification
+        # Send test notification, closing pooled connections in the same loop
         async def send_test():
-            results = await service.send_notification(
-                NotificationEventType.PIPELINE_SUCCESS,
-                test_context,
-                NotificationPriority.NORMAL,
-                channels_to_test
-            )
-            return results
+            try:
+                return await service.send_notification(
+                    NotificationEventType.PIPELINE_SUCCESS,
+                    _TEST_CONTEXT,
+                    NotificationPriority.NORMAL,
+                    channels_to_test
+                )
+            finally:
+                await service.aclose()
         
         results = asyncio.run(send_test())
         
@@ -168,6 +173,8 @@ def test_command(channel: str):
         else:
             print_warning("⚠️ No notifications sent - check your configuration")
     
+    except ConfigNotFoundError:
+        print_error("❌ No pipeline configuration found!")
     except Exception as e:
         print_error(f"Error testing notifications: {str(e)}")
 
@@ -182,10 +189,6 @@ def status_command():
     """
     print_header("Notification Status")
     
-    if not check_config_exists():
-        print_error("❌ No pipeline configuration found!")
-        return
-    
     try:
         # Load configuration and show status
         config = load_config()
@@ -195,23 +198,30 @@ def status_command():
         _display_current_config(notifications_config)
         
         # Show service status
+        from ..notifications.notification_service import NotificationService
+        
         service = NotificationService()
         status = service.get_status()
         
         print_step("Service Status:")
-        print_info(f"📊 Configured channels: {len(status['configured_channels'])}")
-        print_info(f"📈 Total events recorded: {status['total_events']}")
+        lines = [
+            f"📊 Configured channels: {len(status['configured_channels'])}",
+            f"📈 Total events recorded: {status['total_events']}"
+        ]
         
         if status['last_event']:
             last_event = status['last_event']
-            print_info(f"🕐 Last event: {last_event['type']} at {last_event['timestamp']}")
+            lines.append(f"🕐 Last event: {last_event['type']} at {last_event['timestamp']}")
         
         # Show channel status
         config_status = status['configuration']
-        print_info(f"📢 Slack: {'✅ Enabled' if config_status['slack_enabled'] else '❌ Disabled'}")
-        print_info(f"📧 Email: {'✅ Enabled' if config_status['email_enabled'] else '❌ Disabled'}")
-        print_info(f"🔗 Webhook: {'✅ Enabled' if config_status['webhook_enabled'] else '❌ Disabled'}")
+        lines.append(f"📢 Slack: {'✅ Enabled' if config_status['slack_enabled'] else '❌ Disabled'}")
+        lines.append(f"📧 Email: {'✅ Enabled' if config_status['email_enabled'] else '❌ Disabled'}")
+        lines.append(f"🔗 Webhook: {'✅ Enabled' if config_status['webhook_enabled'] else '❌ Disabled'}")
+        print_info_lines(lines)
     
+    except ConfigNotFoundError:
+        print_error("❌ No pipeline configuration found!")
     except Exception as e:
         print_error(f"Error getting notification status: {str(e)}")
 
@@ -233,35 +243,53 @@ def disable_command(channel: str):
     """
     print_header("Disable Notifications")
     
-    if not check_config_exists():
-        print_error("❌ No pipeline configuration found!")
-        return
-    
     try:
         config = load_config()
         notifications_config = config.get("notifications", {})
         
         if channel == "all":
-            channels_to_disable = ["slack", "email", "webhook"]
+            channels_to_disable = _ALL_CHANNELS
         else:
             channels_to_disable = [channel]
         
+        # Update every channel in memory first, then save once
+        changed = False
         for channel_name in channels_to_disable:
-            if channel_name in notifications_config:
+            if channel_name not in notifications_config:
+                print_warning(f"⚠️ {channel_name} not configured")
+            elif notifications_config[channel_name].get("enabled", False):
                 notifications_config[channel_name]["enabled"] = False
+                changed = True
                 print_info(f"❌ Disabled {channel_name} notifications")
             else:
-                print_warning(f"⚠️ {channel_name} not configured")
+                print_info(f"{channel_name} notifications are already disabled")
+        
+        if not changed:
+            print_info("No changes needed")
+            return
         
         config["notifications"] = notifications_config
         save_config(config)
         
         print_success("✅ Notification channels disabled successfully!")
     
+    except ConfigNotFoundError:
+        print_error("❌ No pipeline configuration found!")
     except Exception as e:
         print_error(f"Error disabling notifications: {str(e)}")
 
 
+# (config key, label, detail line or None) for each channel shown in summaries
+_CHANNEL_DISPLAY = (
+    ("slack", "📢 Slack",
+     lambda c: f"Channel: {c.get('channel', '#general')}" if c.get("webhook_url") else None),
+    ("email", "📧 Email",
+     lambda c: f"Recipients: {len(c['to_emails'])} address(es)" if c.get("to_emails") else None),
+    ("webhooks", "🔗 Webhook",
+     lambda c: f"URLs: {len(c['urls'])} configured" if c.get("urls") else None),
+)
+
+
 def _display_current_config(notifications_config: Dict[str, Any]):
     """Display current notification configuration"""
     
@@ -269,37 +297,27 @@ def _display_current_config(notifications_config: Dict[str, Any]):
         print_info("📭 No notifications configured yet")
         return
     
-    # Slack
-    slack_config = notifications_config.get("slack", {})
-    if slack_config:
-        status = "✅ Enabled" if slack_config.get("enabled", False) else "❌ Disabled"
-        print_info(f"📢 Slack: {status}")
-        if slack_config.get("webhook_url"):
-            print_info(f"   Channel: {slack_config.get('channel', '#general')}")
-    
-    # Email
-    email_config = notifications_config.get("email", {})
-    if email_config:
-        status = "✅ Enabled" if email_config.get("enabled", False) else "❌ Disabled"
-        print_info(f"📧 Email: {status}")
-        if email_config.get("to_emails"):
-            print_info(f"   Recipients: {len(email_config['to_emails'])} address(es)")
-    
-    # Webhook
-    webhook_config = notifications_config.get("webhooks", {})
-    if webhook_config:
-        status = "✅ Enabled" if webhook_config.get("enabled", False) else "❌ Disabled"
-        print_info(f"🔗 Webhook: {status}")
-        if webhook_config.get("urls"):
-            print_info(f"   URLs: {len(webhook_config['urls'])} configured")
+    lines = []
+    
+    for key, label, detail in _CHANNEL_DISPLAY:
+        channel_config = notifications_config.get(key)
+        if not channel_config:
+            continue
+        status = "✅ Enabled" if channel_config.get("enabled", False) else "❌ Disabled"
+        lines.append(f"{label}: {status}")
+        detail_line = detail(channel_config)
+        if detail_line:
+            lines.append(f"   {detail_line}")
     
     # Rules
     rules_config = notifications_config.get("rules", {})
     if rules_config:
-        print_info("⚙️ Smart Rules:")
-        print_info(f"   Notify on success: {'✅ Yes' if rules_config.get('notify_on_success', False) else '❌ No'}")
-        print_info(f"   Notify on failure: {'✅ Yes' if rules_config.get('notify_on_failure', True) else '❌ No'}")
-        print_info(f"   Notify on recovery: {'✅ Yes' if rules_config.get('notify_on_recovery', True) else '❌ No'}")
+        lines.append("⚙️ Smart Rules:")
+        lines.append(f"   Notify on success: {'✅ Yes' if rules_config.get('notify_on_success', False) else '❌ No'}")
+        lines.append(f"   Notify on failure: {'✅ Yes' if rules_config.get('notify_on_failure', True) else '❌ No'}")
+        lines.append(f"   Notify on recovery: {'✅ Yes' if rules_config.get('notify_on_recovery', True) else '❌ No'}")
+    
+    print_info_lines(lines)
 
 
 def _configure_channel_interactive(channel_name: str, current_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -313,12 +331,9 @@ def _configure_channel_interactive(channel_name: str, current_config: Dict[str,
     
     config = {"enabled": True}
     
-    if channel_name == "slack":
-        config.update(_configure_slack_interactive(current_config))
-    elif channel_name == "email":
-        config.update(_configure_email_interactive(current_config))
-    elif channel_name == "webhook":
-        config.update(_configure_webhook_interactive(current_config))
+    configure = _INTERACTIVE_CONFIGURERS.get(channel_name)
+    if configure:
+        config.update(configure(current_config))
     
     return config
 
@@ -332,20 +347,24 @@ def _configure_slack_interactive(current_config: Dict[str, Any]) -> Dict[str, An
     print_info("   3. Go to 'Incoming Webhooks' and create a webhook")
     print_info("   4. Copy the webhook URL")
     
-    webhook_url = click.prompt("Slack Webhook URL", 
-                              default=current_config.get("webhook_url", ""),
-                              hide_input=True)
-    
-    channel = click.prompt("Slack Channel", 
-                          default=current_config.get("channel", "#general"))
-    
-    username = click.prompt("Bot Username", 
-                           default=current_config.get("username", "Pipeline Bot"))
+    answers = prompt_form(
+        {
+            "webhook_url": "Slack Webhook URL",
+            "channel": "Slack Channel",
+            "username": "Bot Username"
+        },
+        defaults={
+            "webhook_url": current_config.get("webhook_url", ""),
+            "channel": current_config.get("channel", "#general"),
+            "username": current_config.get("username", "Pipeline Bot")
+        },
+        secret=("webhook_url",)
+    )
     
     return {
-        "webhook_url": webhook_url,
-        "channel": channel,
-        "username": username,
+        "webhook_url": answers["webhook_url"],
+        "channel": answers["channel"],
+        "username": answers["username"],
         "icon_emoji": ":rocket:"
     }
 
@@ -355,34 +374,35 @@ def _configure_email_interactive(current_config: Dict[str, Any]) -> Dict[str, An
     
     print_info("📧 Email SMTP Setup:")
     
-    smtp_server = click.prompt("SMTP Server", 
-                              default=current_config.get("smtp_server", "smtp.gmail.com"))
-    
-    smtp_port = click.prompt("SMTP Port", 
-                            type=int,
-                            default=current_config.get("smtp_port", 587))
-    
-    username = click.prompt("SMTP Username", 
-                           default=current_config.get("username", ""))
-    
-    password = click.prompt("SMTP Password", 
-                           hide_input=True)
-    
     # Get recipient emails
     current_emails = current_config.get("to_emails", [])
     print_info(f"Current recipients: {current_emails}")
     
-    emails_input = click.prompt("Recipient emails (comma-separated)", 
-                               default=",".join(current_emails))
-    
-    to_emails = [email.strip() for email in emails_input.split(",") if email.strip()]
+    answers = prompt_form(
+        {
+            "smtp_server": "SMTP Server",
+            "smtp_port": "SMTP Port",
+            "username": "SMTP Username",
+            "password": "SMTP Password",
+            "to_emails": "Recipient emails (comma-separated)"
+        },
+        defaults={
+            "smtp_server": current_config.get("smtp_server", "smtp.gmail.com"),
+            "smtp_port": current_config.get("smtp_port", 587),
+            "username": current_config.get("username", ""),
+            "to_emails": ",".join(current_emails)
+        },
+        secret=("password",)
+    )
+    
+    to_emails = _split_valid(answers["to_emails"], _EMAIL_RE, "email address")
     
     return {
-        "smtp_server": smtp_server,
-        "smtp_port": smtp_port,
-        "username": username,
-        "password": password,
-        "from_email": username,
+        "smtp_server": answers["smtp_server"],
+        "smtp_port": answers["smtp_port"],
+        "username": answers["username"],
+        "password": answers["password"],
+        "from_email": answers["username"],
         "to_emails": to_emails
     }
 
@@ -399,7 +419,7 @@ def _configure_webhook_interactive(current_config: Dict[str, Any]) -> Dict[str,
     urls_input = click.prompt("Webhook URLs (comma-separated)", 
                              default=",".join(current_urls))
     
-    urls = [url.strip() for url in urls_input.split(",") if url.strip()]
+    urls = _split_valid(urls_input, _URL_RE, "webhook URL")
     
     method = click.prompt("HTTP Method", 
                          type=click.Choice(['POST', 'PUT', 'PATCH']),
@@ -412,6 +432,30 @@ def _configure_webhook_interactive(current_config: Dict[str, Any]) -> Dict[str,
     }
 
 
+def _split_valid(value: str, pattern: "re.Pattern[str]", label: str) -> List[str]:
+    """
+    Split a comma-separated list, keeping only entries that match a pattern
+    
+    Args:
+        value: Comma-separated input
+        pattern: Compiled pattern each entry must fully match
+        label: Entry description used in the warning for skipped entries
+        
+    Returns:
+        List of valid, stripped entries
+    """
+    valid = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if pattern.fullmatch(item):
+            valid.append(item)
+        else:
+            print_warning(f"⚠️ Skipping invalid {label}: {item}")
+    return valid
+
+
 def _configure_rules_interactive(current_rules: Dict[str, Any]) -> Dict[str, Any]:
     """Configure smart notification rules interactively"""
     
@@ -440,36 +484,61 @@ def _configure_rules_interactive(current_rules: Dict[str, Any]) -> Dict[str, Any
     }
 
 
+def _configure_slack_from_env() -> Optional[Dict[str, Any]]:
+    """Configure Slack notifications from environment variables"""
+    env = os.environ
+    webhook_url = env.get("SLACK_WEBHOOK_URL")
+    if not webhook_url:
+        return None
+    
+    return {
+        "enabled": True,
+        "webhook_url": webhook_url,
+        "channel": env.get("SLACK_CHANNEL", "#general"),
+        "username": env.get("SLACK_USERNAME", "Pipeline Bot"),
+        "icon_emoji": ":rocket:"
+    }
+
+
+def _configure_email_from_env() -> Optional[Dict[str, Any]]:
+    """Configure email notifications from environment variables"""
+    env = os.environ
+    smtp_server = env.get("SMTP_SERVER")
+    username = env.get("SMTP_USERNAME")
+    password = env.get("SMTP_PASSWORD")
+    
+    # An unset or blank EMAIL_RECIPIENTS must not count as a recipient list
+    to_emails = [email.strip() for email in env.get("EMAIL_RECIPIENTS", "").split(",") if email.strip()]
+    
+    if not (smtp_server and username and password and to_emails):
+        return None
+    
+    return {
+        "enabled": True,
+        "smtp_server": smtp_server,
+        "smtp_port": int(env.get("SMTP_PORT", "587")),
+        "username": username,
+        "password": password,
+        "from_email": username,
+        "to_emails": to_emails
+    }
+
+
 def _configure_channel_non_interactive(channel_name: str) -> Dict[str, Any]:
     """Configure channel in non-interactive mode (use environment variables)"""
-    import os
-    
-    if channel_name == "slack":
-        webhook_url = os.getenv("SLACK_WEBHOOK_URL")
-        if webhook_url:
-            return {
-                "enabled": True,
-                "webhook_url": webhook_url,
-                "channel": os.getenv("SLACK_CHANNEL", "#general"),
-                "username": os.getenv("SLACK_USERNAME", "Pipeline Bot"),
-                "icon_emoji": ":rocket:"
-            }
-    
-    elif channel_name == "email":
-        smtp_server = os.getenv("SMTP_SERVER")
-        username = os.getenv("SMTP_USERNAME")
-        password = os.getenv("SMTP_PASSWORD")
-        to_emails = os.getenv("EMAIL_RECIPIENTS", "").split(",")
-        
-        if smtp_server and username and password and to_emails:
-            return {
-                "enabled": True,
-                "smtp_server": smtp_server,
-                "smtp_port": int(os.getenv("SMTP_PORT", "587")),
-                "username": username,
-                "password": password,
-                "from_email": username,
-                "to_emails": [email.strip() for email in to_emails if email.strip()]
-            }
-    
-    return {"enabled": False}
\ No newline at end of file
+    configure = _ENV_CONFIGURERS.get(channel_name)
+    config = configure() if configure else None
+    return config or {"enabled": False}
+
+
+# Per-channel configurators, looked up by channel name
+_INTERACTIVE_CONFIGURERS = {
+    "slack": _configure_slack_interactive,
+    "email": _configure_email_interactive,
+    "webhook": _configure_webhook_interactive
+}
+
+_ENV_CONFIGURERS = {
+    "slack": _configure_slack_from_env,
+    "email": _configure_email_from_env
+}
\ No newline at end of file
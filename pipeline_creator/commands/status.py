@@ -5,27 +5,13 @@ This module handles checking the status of the deployed pipeline.
 """
 
 import click
-import json
-from pathlib import Path
 from datetime import datetime
 
 from ..utils.console import (
     print_success, print_error, print_info, print_warning, 
     print_step, print_header
 )
-
-
-def check_config_exists() -> bool:
-    """Check if pipeline configuration exists"""
-    config_path = Path.cwd() / ".pipeline" / "config.json"
-    return config_path.exists()
-
-
-def load_config() -> dict:
-    """Load pipeline configuration"""
-    config_path = Path.cwd() / ".pipeline" / "config.json"
-    with open(config_path, 'r') as f:
-        return json.load(f)
+from ..utils.config import load_config, ConfigNotFoundError
 
 
 @click.command()
@@ -45,14 +31,16 @@ def status_command(detailed: bool, refresh: bool):
     """
     print_header("Pipeline Status")
     
-    # Check if configuration exists
-    if not check_config_exists():
+    print_step("Loading configuration...")
+    try:
+        config = load_config()
+    except ConfigNotFoundError:
         print_error("No pipeline configuration found!")
         print_info("Run 'pipeline init' first to initialize the configuration.")
         return
-    
-    print_step("Loading configuration...")
-    config = load_config()
+    except Exception as e:
+        print_error(f"Error loading configuration: {str(e)}")
+        return
     
     project_name = config.get('project_name', 'my-pipeline')
     environment = config.get('environment', 'dev')
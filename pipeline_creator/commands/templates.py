@@ -3,14 +3,73 @@ Template Management Commands - CLI interface for pipeline templates
 """
 
 import click
+import functools
+import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
 import json
 
 from ..templates.template_service import TemplateService
 from ..templates.template_schema import TemplateCategory
-from ..templates.template_inheritance import TemplateInheritance
-from ..utils.console import print_error, print_success, print_info, print_warning
+from ..utils.console import print_error, print_success, print_info, print_info_lines, print_warning
+from ..utils import json_utils
+
+# Template categories by value, and the values accepted by --category options
+_CATEGORY_BY_VALUE = {cat.value: cat for cat in TemplateCategory}
+_TEMPLATE_CATEGORY_CHOICES = tuple(_CATEGORY_BY_VALUE)
+
+# Icon shown next to each template in listings, by category value
+_CATEGORY_ICONS = {
+    'web-frontend': '🌐',
+    'web-backend': '⚙️',
+    'api': '🔌',
+    'microservice': '🏗️',
+    'mobile': '📱',
+    'desktop': '💻',
+    'data-processing': '📊',
+    'ml-ai': '🤖',
+    'devops': '🔧',
+    'custom': '🎯'
+}
+
+# Answers accepted as true for boolean template parameters
+_TRUE_STRINGS = frozenset({'true', '1', 'yes', 'y'})
+
+# Characters a JSON document can start with
+_JSON_START_CHARS = frozenset('{["tfn-0123456789 \t\r\n')
+
+
+@functools.lru_cache(maxsize=1)
+def _service() -> TemplateService:
+    """
+    Get the template service shared by the subcommands of this process
+    
+    The service holds no template data of its own; the manager rescans the
+    template directories on each lookup, so reusing it never serves stale
+    templates.
+    """
+    return TemplateService()
+
+
+def _parse_parameter_value(value: str) -> Any:
+    """
+    Parse a --parameter value as JSON, falling back to the raw string
+    
+    Values that cannot start a JSON document are returned as-is without
+    attempting to parse them.
+    
+    Args:
+        value: Text after the '=' of a key=value parameter
+        
+    Returns:
+        Parsed JSON value, or the original string
+    """
+    if not value or value[0] not in _JSON_START_CHARS:
+        return value
+    try:
+        return json_utils.loads(value)
+    except json.JSONDecodeError:
+        return value
 
 
 @click.group()
@@ -20,16 +79,27 @@ def templates():
 
 
 @templates.command()
-@click.option('--category', '-c', type=click.Choice([cat.value for cat in TemplateCategory]), 
+@click.option('--category', '-c', type=click.Choice(_TEMPLATE_CATEGORY_CHOICES), 
               help='Filter templates by category')
 @click.option('--format', '-f', type=click.Choice(['table', 'json']), default='table',
               help='Output format')
 def list(category: Optional[str], format: str):
     """List available pipeline templates."""
-    service = TemplateService()
+    show_template_list(category, format)
+
+
+def show_template_list(category: Optional[str] = None, format: str = 'table'):
+    """
+    Print the available templates
+    
+    Args:
+        category: Optional category value to filter by
+        format: Output format, 'table' or 'json'
+    """
+    service = _service()
     
     # Get templates
-    category_filter = TemplateCategory(category) if category else None
+    category_filter = _CATEGORY_BY_VALUE[category] if category else None
     templates = service.get_available_templates(category_filter)
     
     if not templates:
@@ -40,10 +110,9 @@ def list(category: Optional[str], format: str):
         return
     
     if format == 'json':
-        # JSON output
-        templates_data = []
-        for template in templates:
-            templates_data.append({
+        # JSON output, serialized in a single encoder call
+        templates_data = [
+            {
                 'name': template.schema.name,
                 'version': template.schema.version,
                 'description': template.schema.description,
@@ -51,38 +120,39 @@ def list(category: Optional[str], format: str):
                 'author': template.schema.author,
                 'tags': template.schema.tags,
                 'parameters': len(template.schema.parameters)
-            })
+            }
+            for template in templates
+        ]
         
-        click.echo(json.dumps(templates_data, indent=2))
+        # Write the encoded bytes straight to the binary stream when there is
+        # one; captured or wrapped streams (e.g. in tests) go through click
+        payload = json_utils.dumps(templates_data)
+        out = getattr(sys.stdout, 'buffer', None)
+        if out is not None:
+            sys.stdout.flush()
+            out.write(payload)
+            out.flush()
+        else:
+            click.echo(payload, nl=False)
     else:
-        # Table output
-        print_info(f"\n📋 Available Templates ({len(templates)})")
-        print_info("=" * 80)
+        # Table output, printed with a single console write
+        lines = [f"\n📋 Available Templates ({len(templates)})", "=" * 80]
         
         for template in templates:
-            category_icon = {
-                'web-frontend': '🌐',
-                'web-backend': '⚙️',
-                'api': '🔌',
-                'microservice': '🏗️',
-                'mobile': '📱',
-                'desktop': '💻',
-                'data-processing': '📊',
-                'ml-ai': '🤖',
-                'devops': '🔧',
-                'custom': '🎯'
-            }.get(template.schema.category.value, '📦')
+            category_icon = _CATEGORY_ICONS.get(template.schema.category.value, '📦')
             
-            print_info(f"{category_icon} {template.schema.name} (v{template.schema.version})")
-            print_info(f"   📝 {template.schema.description}")
-            print_info(f"   👤 {template.schema.author}")
-            print_info(f"   🏷️  {', '.join(template.schema.tags)}")
-            print_info(f"   ⚙️  {len(template.schema.parameters)} parameters")
+            lines.append(f"{category_icon} {template.schema.name} (v{template.schema.version})")
+            lines.append(f"   📝 {template.schema.description}")
+            lines.append(f"   👤 {template.schema.author}")
+            lines.append(f"   🏷️  {template.schema.tags_display}")
+            lines.append(f"   ⚙️  {len(template.schema.parameters)} parameters")
             
             if template.schema.extends:
-                print_info(f"   🔗 Extends: {template.schema.extends}")
+                lines.append(f"   🔗 Extends: {template.schema.extends}")
             
-            print_info("")
+            lines.append("")
+        
+        print_info_lines(lines)
 
 
 @templates.command()
@@ -93,68 +163,58 @@ def list(category: Optional[str], format: str):
 @click.option('--interactive', '-i', is_flag=True, help='Interactive parameter configuration')
 def use(template_name: str, project_path: Path, parameter: tuple, interactive: bool):
     """Apply a template to create pipeline configuration."""
-    service = TemplateService()
+    service = _service()
     
-    # Get template info
-    template_info = service.get_template_info(template_name)
-    if not template_info:
+    # Load the template once for the description and parameter prompts
+    template = service.template_manager.get_template(template_name)
+    if not template:
         print_error(f"❌ Template '{template_name}' not found")
         click.echo("Use 'pipeline templates list' to see available templates")
         return
     
     print_info(f"🔄 Applying template '{template_name}'...")
-    print_info(f"📝 {template_info['schema']['description']}")
+    print_info(f"📝 {template.schema.description}")
     
     # Parse command line parameters
     parameters = {}
     for param_str in parameter:
-        if '=' not in param_str:
+        key, sep, value = param_str.partition('=')
+        if not sep:
             print_error(f"❌ Invalid parameter format: {param_str}")
             print_info("Use format: --parameter key=value")
             return
         
-        key, value = param_str.split('=', 1)
-        # Try to parse as JSON for complex values
-        try:
-            parameters[key] = json.loads(value)
-        except json.JSONDecodeError:
-            parameters[key] = value
+        parameters[key] = _parse_parameter_value(value)
     
     # Interactive parameter collection
-    if interactive or not parameters:
+    if (interactive or not parameters) and template.schema.parameters:
         print_info("\n⚙️ Template Parameters:")
-        template = service.template_manager.get_template(template_name)
+        
+        # Values given with --parameter; prompted values are merged in after
+        cli_params = dict(parameters)
+        prompted = {}
         
         for param in template.schema.parameters:
-            current_value = parameters.get(param.name)
-            
-            if current_value is not None:
-                print_info(f"✓ {param.name}: {current_value} (from command line)")
+            if param.name in cli_params:
+                print_info(f"✓ {param.name}: {cli_params[param.name]} (from command line)")
                 continue
             
-            # Interactive prompt
-            prompt_text = f"{param.name}"
-            if param.description:
-                prompt_text += f" ({param.description})"
-            
-            if param.default is not None:
-                prompt_text += f" [{param.default}]"
-            
-            if param.options:
-                prompt_text += f" (options: {', '.join(param.options)})"
+            # Interactive prompt, built once and reused for retries
+            prompt_text = "".join((
+                param.name,
+                f" ({param.description})" if param.description else "",
+                f" [{param.default}]" if param.default is not None else "",
+                f" (options: {', '.join(param.options)})" if param.options else ""
+            ))
             
-            if param.required:
-                while True:
-                    value = click.prompt(prompt_text, default=param.default, show_default=False)
-                    if value or not param.required:
-                        break
-                    print_error("This parameter is required")
-            else:
+            value = click.prompt(prompt_text, default=param.default, show_default=False)
+            while param.required and not value:
+                print_error("This parameter is required")
                 value = click.prompt(prompt_text, default=param.default, show_default=False)
             
             # Type conversion
             if param.type.value == 'boolean':
-                value = str(value).lower() in ['true', '1', 'yes', 'y']
+                value = str(value).lower() in _TRUE_STRINGS
             elif param.type.value == 'integer':
                 try:
                     value = int(value)
@@ -162,10 +222,13 @@ def use(template_name: str, project_path: Path, parameter: tuple, interactive: b
                     print_error(f"Invalid integer value: {value}")
                     return
             
-            parameters[param.name] = value
+            prompted[param.name] = value
+        
+        parameters.update(prompted)
     
     # Validate parameters
-    is_valid, errors = service.validate_template_parameters(template_name, parameters)
+    # Validate against the schema already loaded above
+    is_valid, errors = template.schema.validate_parameters(parameters)
     if not is_valid:
         print_error("❌ Parameter validation failed:")
         for error in errors:
@@ -173,7 +236,7 @@ def use(template_name: str, project_path: Path, parameter: tuple, interactive: b
         return
     
     # Apply template
-    if service.apply_template(template_name, project_path, parameters):
+    if service.apply_template(template_name, project_path, parameters, template=template):
         print_success("🎉 Template applied successfully!")
         print_info("Next steps:")
         print_info("  1. Review the generated pipeline.json")
@@ -187,49 +250,58 @@ def use(template_name: str, project_path: Path, parameter: tuple, interactive: b
 @click.argument('template_name')
 def info(template_name: str):
     """Show detailed information about a template."""
-    service = TemplateService()
-    template_info = service.get_template_info(template_name)
+    show_template_info(template_name)
+
+
+def show_template_info(template_name: str):
+    """
+    Print detailed information about a template
     
-    if not template_info:
+    Args:
+        template_name: Name of the template
+    """
+    template = _service().template_manager.get_template(template_name)
+    
+    if not template:
         print_error(f"❌ Template '{template_name}' not found")
         return
     
-    schema = template_info['schema']
+    schema = template.schema
     
-    print_info(f"\n📋 Template: {schema['name']} (v{schema['version']})")
-    print_info("=" * 60)
-    print_info(f"📝 Description: {schema['description']}")
-    print_info(f"🏷️  Category: {schema['category']}")
-    print_info(f"👤 Author: {schema['author']}")
-    print_info(f"🏷️  Tags: {', '.join(schema['tags'])}")
+    lines = [f"\n📋 Template: {schema.name} (v{schema.version})", "=" * 60]
+    lines.append(f"📝 Description: {schema.description}")
+    lines.append(f"🏷️  Category: {schema.category.value}")
+    lines.append(f"👤 Author: {schema.author}")
+    lines.append(f"🏷️  Tags: {schema.tags_display}")
     
-    if schema.get('extends'):
-        print_info(f"🔗 Extends: {schema['extends']}")
+    if schema.extends:
+        lines.append(f"🔗 Extends: {schema.extends}")
     
-    if schema.get('requirements'):
-        print_info(f"📦 Requirements:")
-        for req in schema['requirements']:
-            print_info(f"   • {req}")
+    if schema.requirements:
+        lines.append(f"📦 Requirements:")
+        for req in schema.requirements:
+            lines.append(f"   • {req}")
     
     # Parameters
-    if template_info['parameter_count'] > 0:
-        print_info(f"\n⚙️ Parameters ({template_info['parameter_count']}):")
+    if schema.parameters:
+        lines.append(f"\n⚙️ Parameters ({len(schema.parameters)}):")
         
-        template = service.template_manager.get_template(template_name)
-        for param in template.schema.parameters:
+        for param in schema.parameters:
             status = "required" if param.required else "optional"
-            print_info(f"   • {param.name} ({param.type.value}, {status})")
-            print_info(f"     {param.description}")
+            lines.append(f"   • {param.name} ({param.type.value}, {status})")
+            lines.append(f"     {param.description}")
             
             if param.default is not None:
-                print_info(f"     Default: {param.default}")
+                lines.append(f"     Default: {param.default}")
             
             if param.options:
-                print_info(f"     Options: {', '.join(param.options)}")
+                lines.append(f"     Options: {', '.join(param.options)}")
             
-            print_info("")
+            lines.append("")
     else:
-        print_info("\n⚙️ No parameters required")
+        lines.append("\n⚙️ No parameters required")
+    
+    print_info_lines(lines)
 
 
 @templates.command()
@@ -237,14 +309,14 @@ def info(template_name: str):
 @click.option('--project-path', '-p', type=click.Path(exists=True, path_type=Path),
               default=Path.cwd(), help='Project path to create template from')
 @click.option('--description', '-d', required=True, help='Template description')
-@click.option('--category', '-c', type=click.Choice([cat.value for cat in TemplateCategory]),
+@click.option('--category', '-c', type=click.Choice(_TEMPLATE_CATEGORY_CHOICES),
               required=True, help='Template category')
 @click.option('--author', '-a', required=True, help='Template author')
 @click.option('--tag', '-t', multiple=True, help='Template tags')
 def create(template_name: str, project_path: Path, description: str, 
           category: str, author: str, tag: tuple):
     """Create a new template from existing project."""
-    service = TemplateService()
+    service = _service()
     
     # Check if pipeline.json exists
     pipeline_config = project_path / "pipeline.json"
@@ -292,7 +364,7 @@ def create(template_name: str, project_path: Path, description: str,
         project_path=project_path,
         template_name=template_name,
         description=description,
-        category=TemplateCategory(category),
+        category=_CATEGORY_BY_VALUE[category],
         author=author,
         parameters=parameters,
         tags=list(tag)
@@ -306,7 +378,7 @@ def create(template_name: str, project_path: Path, description: str,
 @click.confirmation_option(prompt='Are you sure you want to delete this template?')
 def delete(template_name: str):
     """Delete a user template."""
-    service = TemplateService()
+    service = _service()
     
     if service.template_manager.delete_template(template_name):
         print_success(f"✅ Template '{template_name}' deleted successfully!")
@@ -316,7 +388,7 @@ def delete(template_name: str):
 @click.argument('template_file', type=click.Path(exists=True, path_type=Path))
 def import_template(template_file: Path):
     """Import a template from file or directory."""
-    service = TemplateService()
+    service = _service()
     
     template = service.template_manager.import_template(template_file)
     if template:
@@ -330,7 +402,7 @@ def import_template(template_file: Path):
 @click.argument('output_path', type=click.Path(path_type=Path))
 def export(template_name: str, output_path: Path):
     """Export a template to file or directory."""
-    service = TemplateService()
+    service = _service()
     
     if service.template_manager.export_template(template_name, output_path):
         print_success(f"✅ Template '{template_name}' exported to {output_path}")
@@ -344,7 +416,9 @@ def export(template_name: str, output_path: Path):
 @click.option('--tag', '-t', multiple=True, help='Additional tags')
 def extend(base_template: str, new_template_name: str, description: str, author: str, tag: tuple):
     """Create a new template that extends an existing one."""
-    service = TemplateService()
+    from ..templates.template_inheritance import TemplateInheritance
+    
+    service = _service()
     inheritance = TemplateInheritance(service.template_manager)
     
     print_info(f"🔄 Creating extended template '{new_template_name}' based on '{base_template}'...")
@@ -356,7 +430,7 @@ def extend(base_template: str, new_template_name: str, description: str, author:
     additional_config = {}
     if additional_config_str:
         try:
-            additional_config = json.loads(additional_config_str)
+            additional_config = json_utils.loads(additional_config_str)
         except json.JSONDecodeError:
             print_error("❌ Invalid JSON format")
             return
@@ -6,28 +6,77 @@ This module defines the main command group and all subcommands for the Pipeline
 """
 
 import click
+import importlib
 import sys
 import os
-from rich.console import Console
-from rich.text import Text
-
-from .utils.console import print_success, print_error, print_info, print_warning
-from .commands.init import init_command
-from .commands.generate import generate_command
-from .commands.deploy import deploy_command
-from .commands.status import status_command
-from .commands.logs import logs_command
-from .commands.add_stage import add_stage_command
-from .commands.notifications import notifications_command
-from .commands.templates import templates
-
-console = Console()
 
 # Context settings for better help formatting
 CONTEXT_SETTINGS = {'help_option_names': ['-h', '--help']}
 
+# Subcommands mapped to "module:attribute" of their click command, imported on use
+LAZY_SUBCOMMANDS = {
+    "init": "pipeline_creator.commands.init:init_command",
+    "generate": "pipeline_creator.commands.generate:generate_command",
+    "deploy": "pipeline_creator.commands.deploy:deploy_command",
+    "status": "pipeline_creator.commands.status:status_command",
+    "logs": "pipeline_creator.commands.logs:logs_command",
+    "add-stage": "pipeline_creator.commands.add_stage:add_stage_command",
+    "notifications": "pipeline_creator.commands.notifications:notifications_command",
+    "templates": "pipeline_creator.commands.templates:templates",
+}
+
+# Short help of the lazy subcommands, so the command list in --help can be
+# shown without importing every command module
+LAZY_SUBCOMMAND_HELP = {
+    "init": "Initialize pipeline configuration in the current directory.",
+    "generate": "Generate AWS CDK infrastructure files for your pipeline.",
+    "deploy": "Deploy the CI/CD pipeline to AWS using CDK.",
+    "status": "Show the current status of your CI/CD pipeline.",
+    "logs": "Show logs from the most recent pipeline execution.",
+    "add-stage": "Add extra build stages to your pipeline.",
+    "notifications": "Configure pipeline notifications.",
+    "templates": "Manage pipeline templates.",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is needed"""
+    
+    def __init__(self, *args, lazy_subcommands=None, lazy_help=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.lazy_help = lazy_help or {}
+    
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+            module = importlib.import_module(module_name)
+            self.commands[cmd_name] = getattr(module, attr_name)
+        return super().get_command(ctx, cmd_name)
+    
+    def format_commands(self, ctx, formatter):
+        rows = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name not in self.commands and cmd_name in self.lazy_help:
+                rows.append((cmd_name, self.lazy_help[cmd_name]))
+                continue
+            
+            cmd = self.get_command(ctx, cmd_name)
+            if cmd is None or cmd.hidden:
+                continue
+            limit = formatter.width - 6 - len(cmd_name)
+            rows.append((cmd_name, cmd.get_short_help_str(limit)))
+        
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
 
-@click.group(context_settings=CONTEXT_SETTINGS, invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS,
+             lazy_help=LAZY_SUBCOMMAND_HELP, context_settings=CONTEXT_SETTINGS, invoke_without_command=True)
 @click.version_option(version='0.1.0', prog_name='pipeline')
 @click.pass_context
 def cli(ctx):
@@ -45,15 +94,19 @@ def cli(ctx):
         pipeline logs              # View deployment logs
     """
     if ctx.invoked_subcommand is None:
+        from rich.text import Text
+        from .utils.console import console, print_info
+        
         # Show welcome message when no command is provided
         welcome_text = Text()
         welcome_text.append("🚀 ", style="bold cyan")
         welcome_text.append("Pipeline Creator CLI", style="bold white")
         welcome_text.append(" v0.1.0", style="dim white")
         
-        console.print("\n")
+        console.print("\n", markup=False, highlight=False)
         console.print(welcome_text)
-        console.print("A modern tool for creating CI/CD pipelines on AWS\n", style="dim")
+        console.print("A modern tool for creating CI/CD pipelines on AWS\n", style="dim",
+                      markup=False, highlight=False)
         
         # Show basic usage
         print_info("Usage: pipeline [OPTIONS] COMMAND [ARGS]...")
@@ -61,23 +114,45 @@ def cli(ctx):
         console.print()
 
 
-# Register all commands
-cli.add_command(init_command, name="init")
-cli.add_command(generate_command, name="generate")
-cli.add_command(deploy_command, name="deploy")
-cli.add_command(status_command, name="status")
-cli.add_command(logs_command, name="logs")
-cli.add_command(add_stage_command, name="add-stage")
-cli.add_command(notifications_command, name="notifications")
-cli.add_command(templates, name="templates")
+def run_fast_path(args) -> bool:
+    """
+    Run common read-only template commands without building a click context
+    
+    Only the exact shapes 'templates list' and 'templates info NAME' are
+    handled; anything with options or other arguments goes through click.
+    
+    Args:
+        args: Command line arguments without the program name
+    
+    Returns:
+        True if the command was handled
+    """
+    if len(args) == 2 and args[0] == "templates" and args[1] == "list":
+        from .commands.templates import show_template_list
+        show_template_list()
+        return True
+    
+    if (len(args) == 3 and args[0] == "templates" and args[1] == "info"
+            and not args[2].startswith("-")):
+        from .commands.templates import show_template_info
+        show_template_info(args[2])
+        return True
+    
+    return False
+
+
 def main():
     """Entry point for the CLI"""
     try:
+        if run_fast_path(sys.argv[1:]):
+            sys.exit(0)
         cli()
     except KeyboardInterrupt:
+        from .utils.console import print_warning
         print_warning("\nOperation cancelled by user")
         sys.exit(1)
     except Exception as e:
+        from .utils.console import print_error
         print_error(f"Unexpected error: {str(e)}")
         sys.exit(1)
 
@@ -5,10 +5,19 @@ This module provides intelligent notification services for pipeline events.
 Supports multiple channels: Slack, Teams, Discord, Email, and Webhooks.
 """
 
-from .notification_service import NotificationService
-from .channels import SlackChannel, EmailChannel, WebhookChannel
-from .templates import NotificationTemplates
-from .event_handlers import PipelineEventHandler
+import importlib
+
+# Public names mapped to the submodule defining them; each submodule is
+# imported on first access (PEP 562), so importing one of them does not
+# load the others
+_LAZY_ATTRS = {
+    'NotificationService': '.notification_service',
+    'SlackChannel': '.channels',
+    'EmailChannel': '.channels',
+    'WebhookChannel': '.channels',
+    'NotificationTemplates': '.templates',
+    'PipelineEventHandler': '.event_handlers'
+}
 
 __all__ = [
     'NotificationService',
@@ -17,4 +26,17 @@ __all__ = [
     'WebhookChannel',
     'NotificationTemplates',
     'PipelineEventHandler'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -4,35 +4,339 @@ Notification Channels - Different channels for sending notifications
 
 import asyncio
 import aiohttp
+import functools
+import random
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+import time
+from collections import OrderedDict
+import html
+from string import Template
+from types import MappingProxyType
+from email import policy
+from email.message import EmailMessage
 from typing import Dict, Any, Optional
-import json
+from urllib.parse import urlsplit
 
+from ..utils import json_utils
 from ..utils.console import print_error, print_success, print_info
-from .notification_service import NotificationEventType, NotificationPriority
+from .notification_service import NotificationEventType, NotificationPriority, context_fingerprint
+
+# HTTP session shared by the Slack and webhook channels, so repeated sends
+# reuse pooled keep-alive connections. A session is bound to the event loop
+# it was created in, so a new one is made when the loop changes.
+_http_session: Optional[aiohttp.ClientSession] = None
+_http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Read-only per-event lookup tables for message formatting
+_SLACK_COLOR_MAP = MappingProxyType({
+    NotificationEventType.PIPELINE_SUCCESS: "good",
+    NotificationEventType.PIPELINE_FAILED: "danger",
+    NotificationEventType.PIPELINE_RECOVERED: "good",
+    NotificationEventType.BUILD_FAILED: "warning",
+    NotificationEventType.DEPLOYMENT_FAILED: "danger",
+})
+
+_SLACK_ICON_MAP = MappingProxyType({
+    NotificationEventType.PIPELINE_SUCCESS: ":white_check_mark:",
+    NotificationEventType.PIPELINE_FAILED: ":x:",
+    NotificationEventType.PIPELINE_RECOVERED: ":arrows_counterclockwise:",
+    NotificationEventType.BUILD_STARTED: ":building_construction:",
+    NotificationEventType.DEPLOYMENT_STARTED: ":rocket:",
+})
+
+# Slack attachment fields as (context key, title, value transform) and
+# action buttons as (context key, button text, style)
+_SLACK_FIELD_SPEC = (
+    ("project", "Project", None),
+    ("branch", "Branch", None),
+    ("commit", "Commit", lambda commit: commit[:8]),
+    ("duration", "Duration", None),
+)
+
+_SLACK_ACTION_SPEC = (
+    ("pipeline_url", "View Pipeline", "primary"),
+    ("logs_url", "View Logs", None),
+)
+
+_EMAIL_COLOR_MAP = MappingProxyType({
+    NotificationEventType.PIPELINE_SUCCESS: "#28a745",
+    NotificationEventType.PIPELINE_FAILED: "#dc3545",
+    NotificationEventType.PIPELINE_RECOVERED: "#17a2b8",
+    NotificationEventType.BUILD_FAILED: "#ffc107",
+    NotificationEventType.DEPLOYMENT_FAILED: "#dc3545",
+})
+
+# HTML email skeleton, parsed once at import. Values are HTML-escaped by the
+# caller before substitution.
+_EMAIL_HTML_TEMPLATE = Template("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>$title</title>
+        </head>
+        <body style="margin: 0; padding: 20px; background-color: #f8f9fa; font-family: Arial, sans-serif;">
+            <div style="max-width: 600px; margin: 0 auto; background-color: white; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                <!-- Header -->
+                <div style="background-color: $primary_color; color: white; padding: 20px; border-radius: 8px 8px 0 0;">
+                    <h1 style="margin: 0; font-size: 24px;">$title</h1>
+                </div>
+                
+                <!-- Content -->
+                <div style="padding: 20px;">
+                    <p style="font-size: 16px; line-height: 1.6; color: #333;">
+                        $description
+                    </p>
+                    
+                    <!-- Context Information -->
+                    <div style="background-color: #f8f9fa; border-left: 4px solid $primary_color; padding: 15px; margin: 20px 0;">
+                        <h3 style="margin-top: 0; color: #333;">Pipeline Details</h3>
+                        <table style="width: 100%; border-collapse: collapse;">
+        $rows
+                        </table>
+                    </div>
+                    
+                    <!-- Action Buttons -->
+        $actions
+                </div>
+                
+                <!-- Footer -->
+                <div style="background-color: #f8f9fa; padding: 15px; border-radius: 0 0 8px 8px; text-align: center; color: #666;">
+                    <small>Sent by Pipeline Creator • Configure notifications with <code>pipeline notifications setup</code></small>
+                </div>
+            </div>
+        </body>
+        </html>
+        """)
+
+_EMAIL_ROW_TEMPLATE = Template("""
+                            <tr>
+                                <td style="padding: 8px 0; font-weight: bold; color: #666; width: 30%;">$key:</td>
+                                <td style="padding: 8px 0; color: #333;">$value</td>
+                            </tr>
+                """)
+
+_EMAIL_BUTTON_TEMPLATE = Template("""
+                    <a href="$url" 
+                       style="display: inline-block; background-color: $color; color: white; 
+                              padding: 12px 24px; text-decoration: none; border-radius: 4px; 
+                              margin: 0 10px; font-weight: bold;">
+                        $label
+                    </a>
+                """)
+
+# asyncio.to_thread is Python 3.9+; fall back to the running loop's default
+# executor on 3.8
+if hasattr(asyncio, "to_thread"):
+    _to_thread = asyncio.to_thread
+else:
+    async def _to_thread(func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+@functools.lru_cache(maxsize=2048)
+def _esc(value: str, quote: bool = True) -> str:
+    """
+    Escape text for HTML (email) or Slack markup, memoizing repeated values
+    
+    Slack only treats &, < and > as control characters, so Slack text is
+    escaped with quote=False.
+    """
+    return html.escape(value, quote=quote)
+
+
+def _serialize_json(obj: Any) -> str:
+    """Compact JSON encoder for request bodies, using orjson when installed"""
+    return json_utils.dumps(obj, indent=False).decode("utf-8")
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session for the running event loop
+    
+    Returns:
+        Open aiohttp session with a pooled connector
+    """
+    global _http_session, _http_session_loop
+    
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session.closed or _http_session_loop is not loop:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75
+            ),
+            json_serialize=_serialize_json
+        )
+        _http_session_loop = loop
+    return _http_session
+
+
+async def close_http_session():
+    """Close the shared HTTP session if it belongs to the running event loop"""
+    global _http_session, _http_session_loop
+    
+    if (_http_session is not None and not _http_session.closed
+            and _http_session_loop is asyncio.get_running_loop()):
+        await _http_session.close()
+    _http_session = None
+    _http_session_loop = None
+
+
+# Outbound HTTP pacing: requests to one host are spaced to at most
+# _HOST_RATE_LIMIT per second, and 429 and 5xx responses or network errors
+# are retried with jittered exponential backoff. A Retry-After header on a
+# retried response is honoured up to _HTTP_MAX_BACKOFF seconds.
+_HOST_RATE_LIMIT = 30
+_HTTP_MAX_ATTEMPTS = 4
+_HTTP_MAX_BACKOFF = 2.0
+_host_next_slot: Dict[str, float] = {}
+
+
+async def _wait_for_host_slot(url: str):
+    """Reserve the next send slot for the URL's host, sleeping until it opens"""
+    host = urlsplit(url).netloc
+    now = time.monotonic()
+    slot = max(now, _host_next_slot.get(host, 0.0))
+    _host_next_slot[host] = slot + 1 / _HOST_RATE_LIMIT
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+def _is_retryable_status(status: int) -> bool:
+    """Check if a response status is worth retrying"""
+    return status == 429 or status >= 500
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds; HTTP dates are ignored"""
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+async def _request_with_retry(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    timeout: float,
+    **kwargs
+) -> int:
+    """
+    Send an HTTP request with per-host rate limiting and retries
+    
+    Every attempt, and the backoff between attempts, fits within one overall
+    deadline; no retry is made once the deadline leaves no room for it.
+    
+    Args:
+        session: HTTP session to send with
+        method: HTTP method
+        url: Destination URL
+        timeout: Deadline in seconds for the whole send, retries included
+        **kwargs: Extra arguments for session.request
+    
+    Returns:
+        Status code of the final attempt
+    
+    Raises:
+        aiohttp.ClientError or asyncio.TimeoutError if the last attempt fails
+        or the deadline passes
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    for attempt in range(_HTTP_MAX_ATTEMPTS):
+        await _wait_for_host_slot(url)
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        
+        error = None
+        retry_after = None
+        try:
+            async with session.request(
+                method, url, timeout=aiohttp.ClientTimeout(total=remaining), **kwargs
+            ) as response:
+                status = response.status
+                if _is_retryable_status(status):
+                    retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error = e
+        
+        if retry_after is not None:
+            backoff = min(retry_after, _HTTP_MAX_BACKOFF)
+        else:
+            backoff = 0.25 * 2 ** attempt + random.random() * 0.1
+        final_attempt = (attempt == _HTTP_MAX_ATTEMPTS - 1
+                         or loop.time() + backoff >= deadline)
+        if error is None and (not _is_retryable_status(status) or final_attempt):
+            return status
+        if error is not None and final_attempt:
+            raise error
+        await asyncio.sleep(backoff)
 
 
 class BaseChannel:
     """Base class for notification channels"""
     
+    # Identical messages sent again within this many seconds are skipped
+    DEDUPE_WINDOW = 5.0
+    DEDUPE_MAX_ENTRIES = 256
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.enabled = config.get("enabled", False)
+        # Deadline in seconds for each send, retries included; SMTP applies
+        # it to each socket operation
+        self.timeout = config.get("timeout", 5)
+        self._recent: "OrderedDict[int, float]" = OrderedDict()
+        self.deduplicated_count = 0
     
     async def send(
         self, 
         message: Dict[str, Any], 
         event_type: NotificationEventType,
         priority: NotificationPriority
-    ) -> bool:
-        """Send notification through this channel"""
+    ) -> Optional[bool]:
+        """
+        Send notification through this channel
+        
+        Returns:
+            True if delivered, False if the send failed, or None if the
+            message was suppressed as a repeat of one just delivered
+        """
         raise NotImplementedError("Subclasses must implement send method")
     
     def is_enabled(self) -> bool:
         """Check if channel is enabled"""
         return self.enabled
+    
+    def _dedupe_key(self, message: Dict[str, Any], event_type: NotificationEventType) -> int:
+        """Key a message by event type and context, ignoring its timestamp"""
+        return hash((event_type.value, context_fingerprint(message.get("context", {}))))
+    
+    def _sent_recently(self, key: int) -> bool:
+        """Check if a message with this key was delivered within the dedupe window"""
+        sent_at = self._recent.get(key)
+        return sent_at is not None and time.monotonic() - sent_at < self.DEDUPE_WINDOW
+    
+    def _skip_duplicate(self) -> None:
+        """Report and count a suppressed duplicate; it is not a delivery"""
+        self.deduplicated_count += 1
+        label = self.__class__.__name__[:-len("Channel")]
+        print_info(f"Skipped duplicate {label} notification")
+        return None
+    
+    def _mark_sent(self, key: int):
+        """Record a delivered message, evicting the oldest entries past the limit"""
+        self._recent[key] = time.monotonic()
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.DEDUPE_MAX_ENTRIES:
+            self._recent.popitem(last=False)
+    
+    async def aclose(self):
+        """Release resources held by this channel"""
 
 
 class SlackChannel(BaseChannel):
@@ -50,8 +354,15 @@ class SlackChannel(BaseChannel):
         message: Dict[str, Any], 
         event_type: NotificationEventType,
         priority: NotificationPriority
-    ) -> bool:
+    ) -> Optional[bool]:
         """Send Slack notification"""
+        if not self.enabled:
+            return False
+        
+        dedupe_key = self._dedupe_key(message, event_type)
+        if self._sent_recently(dedupe_key):
+            return self._skip_duplicate()
+        
         if not self.webhook_url:
             print_error("Slack webhook URL not configured")
             return False
@@ -60,19 +371,26 @@ class SlackChannel(BaseChannel):
             # Format Slack message
             slack_message = self._format_slack_message(message, event_type, priority)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_url,
-                    json=slack_message,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    success = response.status == 200
-                    if success:
-                        print_info("✅ Slack notification sent successfully")
-                    else:
-                        print_error(f"❌ Slack notification failed: {response.status}")
-                    return success
+            session = await get_http_session()
+            status = await _request_with_retry(
+                session,
+                "POST",
+                self.webhook_url,
+                self.timeout,
+                json=slack_message,
+                headers={"Content-Type": "application/json"}
+            )
+            success = status == 200
+            if success:
+                self._mark_sent(dedupe_key)
+                print_info("✅ Slack notification sent successfully")
+            else:
+                print_error(f"❌ Slack notification failed: {status}")
+            return success
         
+        except asyncio.TimeoutError:
+            print_error(f"Slack notification timed out after {self.timeout}s")
+            return False
         except Exception as e:
             print_error(f"Error sending Slack notification: {str(e)}")
             return False
@@ -85,32 +403,14 @@ class SlackChannel(BaseChannel):
     ) -> Dict[str, Any]:
         """Format message for Slack"""
         
-        # Color mapping for different event types
-        color_map = {
-            NotificationEventType.PIPELINE_SUCCESS: "good",
-            NotificationEventType.PIPELINE_FAILED: "danger",
-            NotificationEventType.PIPELINE_RECOVERED: "good",
-            NotificationEventType.BUILD_FAILED: "warning",
-            NotificationEventType.DEPLOYMENT_FAILED: "danger",
-        }
-        
-        # Icon mapping
-        icon_map = {
-            NotificationEventType.PIPELINE_SUCCESS: ":white_check_mark:",
-            NotificationEventType.PIPELINE_FAILED: ":x:",
-            NotificationEventType.PIPELINE_RECOVERED: ":arrows_counterclockwise:",
-            NotificationEventType.BUILD_STARTED: ":building_construction:",
-            NotificationEventType.DEPLOYMENT_STARTED: ":rocket:",
-        }
-        
-        color = color_map.get(event_type, "#36a64f")
-        icon = icon_map.get(event_type, ":information_source:")
+        color = _SLACK_COLOR_MAP.get(event_type, "#36a64f")
+        icon = _SLACK_ICON_MAP.get(event_type, ":information_source:")
         
         # Build attachment
         attachment = {
             "color": color,
-            "title": f"{icon} {message['title']}",
-            "text": message['description'],
+            "title": f"{icon} {_esc(message['title'], quote=False)}",
+            "text": _esc(message['description'], quote=False),
             "fields": [],
             "footer": "Pipeline Creator",
             "ts": message.get("timestamp", "")
@@ -118,50 +418,25 @@ class SlackChannel(BaseChannel):
         
         # Add context fields
         context = message.get("context", {})
-        if context.get("project"):
-            attachment["fields"].append({
-                "title": "Project",
-                "value": context["project"],
-                "short": True
-            })
-        
-        if context.get("branch"):
-            attachment["fields"].append({
-                "title": "Branch", 
-                "value": context["branch"],
-                "short": True
-            })
-        
-        if context.get("commit"):
-            attachment["fields"].append({
-                "title": "Commit",
-                "value": context["commit"][:8],
-                "short": True
-            })
-        
-        if context.get("duration"):
-            attachment["fields"].append({
-                "title": "Duration",
-                "value": context["duration"],
-                "short": True
-            })
+        for key, title, transform in _SLACK_FIELD_SPEC:
+            value = context.get(key)
+            if value:
+                text = str(value)
+                attachment["fields"].append({
+                    "title": title,
+                    "value": _esc(transform(text) if transform else text, quote=False),
+                    "short": True
+                })
         
         # Add action buttons if applicable
         actions = []
-        if context.get("pipeline_url"):
-            actions.append({
-                "type": "button",
-                "text": "View Pipeline",
-                "url": context["pipeline_url"],
-                "style": "primary"
-            })
-        
-        if context.get("logs_url"):
-            actions.append({
-                "type": "button", 
-                "text": "View Logs",
-                "url": context["logs_url"]
-            })
+        for key, text, style in _SLACK_ACTION_SPEC:
+            url = context.get(key)
+            if url:
+                action = {"type": "button", "text": text, "url": url}
+                if style:
+                    action["style"] = style
+                actions.append(action)
         
         if actions:
             attachment["actions"] = actions
@@ -185,14 +460,27 @@ class EmailChannel(BaseChannel):
         self.password = config.get("password", "")
         self.from_email = config.get("from_email", self.username)
         self.to_emails = config.get("to_emails", [])
+        # Set "html": false to send plain text only
+        self.html_enabled = config.get("html", True)
+        # SMTP connection reused across sends; the lock serializes executor
+        # threads since smtplib connections are not thread-safe
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
     
     async def send(
         self, 
         message: Dict[str, Any], 
         event_type: NotificationEventType,
         priority: NotificationPriority
-    ) -> bool:
+    ) -> Optional[bool]:
         """Send email notification"""
+        if not self.enabled:
+            return False
+        
+        dedupe_key = self._dedupe_key(message, event_type)
+        if self._sent_recently(dedupe_key):
+            return self._skip_duplicate()
+        
         if not self.to_emails:
             print_error("No email recipients configured")
             return False
@@ -202,10 +490,12 @@ class EmailChannel(BaseChannel):
             email_msg = self._format_email_message(message, event_type, priority)
             
             # Send email (run in thread pool to avoid blocking)
-            loop = asyncio.get_event_loop()
-            success = await loop.run_in_executor(None, self._send_smtp_email, email_msg)
+            # The SMTP socket carries the timeout, since a worker thread
+            # cannot be cancelled from here
+            success = await _to_thread(self._send_smtp_email, email_msg)
             
             if success:
+                self._mark_sent(dedupe_key)
                 print_info("✅ Email notification sent successfully")
             else:
                 print_error("❌ Email notification failed")
@@ -221,39 +511,36 @@ class EmailChannel(BaseChannel):
         message: Dict[str, Any], 
         event_type: NotificationEventType,
         priority: NotificationPriority
-    ) -> MIMEMultipart:
+    ) -> EmailMessage:
         """Format email message"""
         
-        msg = MIMEMultipart("alternative")
+        msg = EmailMessage(policy=policy.SMTP)
         msg["Subject"] = f"[Pipeline] {message['title']}"
         msg["From"] = self.from_email
         msg["To"] = ", ".join(self.to_emails)
         
         # Create text version
-        text_content = f"""
+        context = message.get("context", {})
+        parts = [f"""
 {message['title']}
 
 {message['description']}
 
 Context:
-"""
-        
-        context = message.get("context", {})
-        for key, value in context.items():
-            if value:
-                text_content += f"- {key.replace('_', ' ').title()}: {value}\n"
-        
-        text_content += "\n---\nSent by Pipeline Creator"
-        
-        # Create HTML version
-        html_content = self._generate_html_email(message, event_type, priority)
-        
-        # Attach both versions
-        text_part = MIMEText(text_content, "plain")
-        html_part = MIMEText(html_content, "html")
-        
-        msg.attach(text_part)
-        msg.attach(html_part)
+"""]
+        parts.extend(
+            f"- {key.replace('_', ' ').title()}: {value}\n"
+            for key, value in context.items()
+            if value
+        )
+        parts.append("\n---\nSent by Pipeline Creator")
+        text_content = "".join(parts)
+        
+        # Plain text body, with an HTML alternative unless disabled
+        msg.set_content(text_content)
+        if self.html_enabled:
+            html_content = self._generate_html_email(message, event_type, priority)
+            msg.add_alternative(html_content, subtype="html")
         
         return msg
     
@@ -265,118 +552,89 @@ Context:
     ) -> str:
         """Generate HTML email content"""
         
-        # Color scheme based on event type
-        color_map = {
-            NotificationEventType.PIPELINE_SUCCESS: "#28a745",
-            NotificationEventType.PIPELINE_FAILED: "#dc3545",
-            NotificationEventType.PIPELINE_RECOVERED: "#17a2b8",
-            NotificationEventType.BUILD_FAILED: "#ffc107",
-            NotificationEventType.DEPLOYMENT_FAILED: "#dc3545",
-        }
-        
-        primary_color = color_map.get(event_type, "#007bff")
+        primary_color = _EMAIL_COLOR_MAP.get(event_type, "#007bff")
         context = message.get("context", {})
         
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{message['title']}</title>
-        </head>
-        <body style="margin: 0; padding: 20px; background-color: #f8f9fa; font-family: Arial, sans-serif;">
-            <div style="max-width: 600px; margin: 0 auto; background-color: white; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-                <!-- Header -->
-                <div style="background-color: {primary_color}; color: white; padding: 20px; border-radius: 8px 8px 0 0;">
-                    <h1 style="margin: 0; font-size: 24px;">{message['title']}</h1>
-                </div>
-                
-                <!-- Content -->
-                <div style="padding: 20px;">
-                    <p style="font-size: 16px; line-height: 1.6; color: #333;">
-                        {message['description']}
-                    </p>
-                    
-                    <!-- Context Information -->
-                    <div style="background-color: #f8f9fa; border-left: 4px solid {primary_color}; padding: 15px; margin: 20px 0;">
-                        <h3 style="margin-top: 0; color: #333;">Pipeline Details</h3>
-                        <table style="width: 100%; border-collapse: collapse;">
-        """
-        
-        # Add context rows
-        for key, value in context.items():
-            if value:
-                display_key = key.replace('_', ' ').title()
-                html += f"""
-                            <tr>
-                                <td style="padding: 8px 0; font-weight: bold; color: #666; width: 30%;">{display_key}:</td>
-                                <td style="padding: 8px 0; color: #333;">{value}</td>
-                            </tr>
-                """
-        
-        html += """
-                        </table>
-                    </div>
-                    
-                    <!-- Action Buttons -->
-        """
-        
-        # Add action buttons
-        if context.get("pipeline_url") or context.get("logs_url"):
-            html += '<div style="text-align: center; margin: 30px 0;">'
-            
-            if context.get("pipeline_url"):
-                html += f"""
-                    <a href="{context['pipeline_url']}" 
-                       style="display: inline-block; background-color: {primary_color}; color: white; 
-                              padding: 12px 24px; text-decoration: none; border-radius: 4px; 
-                              margin: 0 10px; font-weight: bold;">
-                        View Pipeline
-                    </a>
-                """
-            
-            if context.get("logs_url"):
-                html += f"""
-                    <a href="{context['logs_url']}" 
-                       style="display: inline-block; background-color: #6c757d; color: white; 
-                              padding: 12px 24px; text-decoration: none; border-radius: 4px; 
-                              margin: 0 10px; font-weight: bold;">
-                        View Logs
-                    </a>
-                """
-            
-            html += '</div>'
-        
-        html += """
-                </div>
-                
-                <!-- Footer -->
-                <div style="background-color: #f8f9fa; padding: 15px; border-radius: 0 0 8px 8px; text-align: center; color: #666;">
-                    <small>Sent by Pipeline Creator • Configure notifications with <code>pipeline notifications setup</code></small>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+        # Context rows, escaped since commit messages and branch names are
+        # free-form text
+        rows = "".join(
+            _EMAIL_ROW_TEMPLATE.substitute(
+                key=_esc(key.replace('_', ' ').title()),
+                value=_esc(str(value))
+            )
+            for key, value in context.items()
+            if value
+        )
+        
+        # Action buttons
+        buttons = []
+        if context.get("pipeline_url"):
+            buttons.append(_EMAIL_BUTTON_TEMPLATE.substitute(
+                url=_esc(context['pipeline_url']), color=primary_color, label="View Pipeline"
+            ))
+        if context.get("logs_url"):
+            buttons.append(_EMAIL_BUTTON_TEMPLATE.substitute(
+                url=_esc(context['logs_url']), color="#6c757d", label="View Logs"
+            ))
+        actions = ""
+        if buttons:
+            actions = '<div style="text-align: center; margin: 30px 0;">' + "".join(buttons) + '</div>'
+        
+        return _EMAIL_HTML_TEMPLATE.substitute(
+            title=_esc(message['title']),
+            description=_esc(message['description']),
+            primary_color=primary_color,
+            rows=rows,
+            actions=actions
+        )
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Connect, STARTTLS and log in on first use, then reuse the connection"""
+        if self._smtp is None:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.timeout)
+            try:
+                server.starttls()
+                server.login(self.username, self.password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
     
-    def _send_smtp_email(self, msg: MIMEMultipart) -> bool:
+    def _close_smtp(self):
+        """Close the SMTP connection if one is open"""
+        server, self._smtp = self._smtp, None
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                server.close()
+    
+    def _send_smtp_email(self, msg: EmailMessage) -> bool:
         """Send email via SMTP"""
-        try:
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.username, self.password)
-            
-            text = msg.as_string()
-            server.sendmail(self.from_email, self.to_emails, text)
-            server.quit()
-            
-            return True
-        except Exception as e:
-            print_error(f"SMTP error: {str(e)}")
-            return False
+        with self._smtp_lock:
+            try:
+                try:
+                    self._get_smtp().send_message(msg, self.from_email, self.to_emails)
+                except smtplib.SMTPServerDisconnected:
+                    # The server dropped an idle connection; reconnect once
+                    self._smtp = None
+                    self._get_smtp().send_message(msg, self.from_email, self.to_emails)
+                
+                return True
+            except Exception as e:
+                self._close_smtp()
+                print_error(f"SMTP error: {str(e)}")
+                return False
+    
+    async def aclose(self):
+        """Close the persistent SMTP connection"""
+        def close():
+            with self._smtp_lock:
+                self._close_smtp()
+        
+        if self._smtp is not None:
+            await _to_thread(close)
 
 
 class WebhookChannel(BaseChannel):
@@ -393,8 +651,15 @@ class WebhookChannel(BaseChannel):
         message: Dict[str, Any], 
         event_type: NotificationEventType,
         priority: NotificationPriority
-    ) -> bool:
+    ) -> Optional[bool]:
         """Send webhook notification"""
+        if not self.enabled:
+            return False
+        
+        dedupe_key = self._dedupe_key(message, event_type)
+        if self._sent_recently(dedupe_key):
+            return self._skip_duplicate()
+        
         if not self.urls:
             print_error("No webhook URLs configured")
             return False
@@ -403,26 +668,17 @@ class WebhookChannel(BaseChannel):
             # Format webhook payload
             payload = self._format_webhook_payload(message, event_type, priority)
             
-            # Send to all configured URLs
-            success_count = 0
-            async with aiohttp.ClientSession() as session:
-                for url in self.urls:
-                    try:
-                        async with session.request(
-                            self.method,
-                            url,
-                            json=payload,
-                            headers=self.headers
-                        ) as response:
-                            if 200 <= response.status < 300:
-                                success_count += 1
-                            else:
-                                print_error(f"Webhook failed for {url}: {response.status}")
-                    except Exception as e:
-                        print_error(f"Webhook error for {url}: {str(e)}")
+            # Send to all configured URLs concurrently; the connector caps
+            # connections per host
+            session = await get_http_session()
+            results = await asyncio.gather(
+                *(self._post_one(session, url, payload) for url in self.urls)
+            )
+            success_count = sum(results)
             
             success = success_count > 0
             if success:
+                self._mark_sent(dedupe_key)
                 print_info(f"✅ Webhook notifications sent to {success_count}/{len(self.urls)} URLs")
             else:
                 print_error("❌ All webhook notifications failed")
@@ -433,6 +689,28 @@ class WebhookChannel(BaseChannel):
             print_error(f"Error sending webhook notifications: {str(e)}")
             return False
     
+    async def _post_one(self, session: aiohttp.ClientSession, url: str, payload: Dict[str, Any]) -> bool:
+        """Send the payload to one webhook URL, reporting failures"""
+        try:
+            status = await _request_with_retry(
+                session,
+                self.method,
+                url,
+                self.timeout,
+                json=payload,
+                headers=self.headers
+            )
+            if 200 <= status < 300:
+                return True
+            print_error(f"Webhook failed for {url}: {status}")
+            return False
+        except asyncio.TimeoutError:
+            print_error(f"Webhook timed out for {url} after {self.timeout}s")
+            return False
+        except Exception as e:
+            print_error(f"Webhook error for {url}: {str(e)}")
+            return False
+    
     def _format_webhook_payload(
         self, 
         message: Dict[str, Any], 
@@ -445,7 +723,7 @@ class WebhookChannel(BaseChannel):
             "priority": priority.value,
             "title": message["title"],
             "description": message["description"],
-            "context": message.get("context", {}),
+            "context": dict(message.get("context", {})),
             "timestamp": message.get("timestamp"),
             "source": "pipeline-creator"
         }
\ No newline at end of file
@@ -3,19 +3,100 @@ Event Handlers - Handle pipeline events and trigger notifications
 """
 
 import asyncio
-from typing import Dict, Any, Optional
+import functools
+from collections import ChainMap
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from datetime import datetime, timezone
 
-from .notification_service import NotificationService, NotificationEventType, NotificationPriority
+from .notification_service import (
+    NotificationService, NotificationEventType, NotificationPriority, context_fingerprint
+)
 from ..utils.console import print_info, print_error
 
 
+@functools.lru_cache(maxsize=256)
+def _format_whole_seconds(seconds: int) -> str:
+    """Format a whole number of seconds in human-readable format"""
+    if seconds < 60:
+        return f"{seconds}s"
+    elif seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    else:
+        return f"{seconds // 3600}h {(seconds % 3600) // 60}m"
+
+
+def _format_duration(seconds: float) -> str:
+    """Format duration in human-readable format"""
+    return _format_whole_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' on older Pythons"""
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+# Bound str.format methods for the AWS console URLs
+_PIPELINE_URL_FORMAT = "https://console.aws.amazon.com/codesuite/codepipeline/pipelines/{project}-pipeline/view?region={region}".format
+_LOGS_URL_FORMAT = "https://console.aws.amazon.com/cloudwatch/home?region={region}#logsV2:log-groups/log-group//aws/codebuild/{job_id}".format
+
+
+@functools.lru_cache(maxsize=256)
+def _construct_pipeline_url(project_name: str, aws_region: str) -> str:
+    """Construct AWS CodePipeline URL"""
+    return _PIPELINE_URL_FORMAT(project=project_name, region=aws_region)
+
+
+@functools.lru_cache(maxsize=256)
+def _construct_logs_url(job_id: str, aws_region: str) -> str:
+    """Construct AWS CloudWatch logs URL"""
+    return _LOGS_URL_FORMAT(job_id=job_id, region=aws_region)
+
+
+def _handler_closed_error() -> RuntimeError:
+    """Error for events still waiting when the handler is closed"""
+    return RuntimeError("Notification handler closed before the event was sent")
+
+
+def _fail_waiters(batch: List[Tuple], error: Exception):
+    """Resolve the still pending futures of a batch with an error"""
+    for *_, future in batch:
+        if not future.done():
+            future.set_exception(error)
+
+
+_EVENT_TYPES_BY_VALUE = {event.value: event for event in NotificationEventType}
+_PRIORITIES_BY_VALUE = {priority.value: priority for priority in NotificationPriority}
+
+
 class PipelineEventHandler:
-    """Handle pipeline events and trigger appropriate notifications"""
+    """
+    Handle pipeline events and trigger appropriate notifications
+    
+    Use it as an async context manager (async with PipelineEventHandler()
+    as handler) or call aclose() when done, so network resources are
+    released before the event loop closes.
+    """
+    
+    # A lone event is sent right away; once a burst is seen, events arriving
+    # within this window join its batch. Identical events in a batch are
+    # sent only once.
+    COALESCE_WINDOW = 0.2
+    MAX_BATCH_SIZE = 100
+    QUEUE_SIZE = 1000
+    # How long a producer waits for room in a full queue before the event
+    # is dropped
+    ENQUEUE_TIMEOUT = 1.0
     
     def __init__(self, config_path: str = ".pipeline/config.json"):
         self.notification_service = NotificationService(config_path)
         self.current_pipeline_state = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._queue_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher: Optional[asyncio.Task] = None
     
     async def handle_pipeline_event(
         self, 
@@ -34,20 +115,26 @@ class PipelineEventHandler:
         Returns:
             True if notifications were sent successfully
         """
+        # Convert strings to enums with a lookup rather than a raised ValueError
+        notification_event = _EVENT_TYPES_BY_VALUE.get(event_type)
+        notification_priority = _PRIORITIES_BY_VALUE.get(priority)
+        if notification_event is None or notification_priority is None:
+            print_error(f"Invalid event type or priority: {event_type!r}, {priority!r}")
+            return False
+        
         try:
-            # Convert string event type to enum
-            notification_event = NotificationEventType(event_type)
-            notification_priority = NotificationPriority(priority)
-            
             # Enhance context with additional information
             enhanced_context = self._enhance_context(context, notification_event)
             
-            # Send notifications
-            results = await self.notification_service.send_notification(
+            # Queue for the next coalesced dispatch and wait for its result
+            results = await self._enqueue(
                 notification_event,
                 enhanced_context,
                 notification_priority
             )
+            if results is None:
+                print_error("❌ Notification queue is full, event dropped")
+                return False
             
             # Log results
             if results:
@@ -59,80 +146,195 @@ class PipelineEventHandler:
                     print_error("❌ All notifications failed to send")
                     return False
             else:
-                print_info("ℹ️ No notifications sent (smart rules or no channels configured)")
+                print_info("ℹ️ No notifications sent (smart rules, duplicates or no channels configured)")
                 return True
         
-        except ValueError as e:
-            print_error(f"Invalid event type or priority: {str(e)}")
-            return False
         except Exception as e:
             print_error(f"Error handling pipeline event: {str(e)}")
             return False
     
+    async def _enqueue(
+        self,
+        event_type: NotificationEventType,
+        context: Mapping[str, Any],
+        priority: NotificationPriority
+    ) -> Optional[Dict[str, bool]]:
+        """
+        Queue an event for the background flusher
+        
+        Returns:
+            Channel results once the event is sent, or None if the queue
+            stayed full past ENQUEUE_TIMEOUT
+        """
+        loop = asyncio.get_running_loop()
+        if self._queue_loop is not loop:
+            # A queue is bound to the loop it is used in, so start fresh
+            self._queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+            self._queue_loop = loop
+            self._flusher = None
+        
+        future = loop.create_future()
+        item = (event_type, context, priority, future)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(item), timeout=self.ENQUEUE_TIMEOUT)
+            except asyncio.TimeoutError:
+                return None
+        
+        # Start the flusher only once the event is queued, so it never sees
+        # an empty queue and exits before handling it
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.ensure_future(self._flush_events())
+        return await future
+    
+    async def _flush_events(self):
+        """Dispatch queued events in batches until the queue is idle"""
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch: List[Tuple] = []
+            try:
+                await self._collect_batch(loop, batch)
+                await self._dispatch_batch(batch)
+            except asyncio.CancelledError:
+                # Nothing will send the partial batch or the rest of the
+                # queue any more, so release their waiters
+                self._drain_queue(batch)
+                _fail_waiters(batch, _handler_closed_error())
+                raise
+            except Exception as e:
+                _fail_waiters(batch, e)
+    
+    async def _collect_batch(self, loop: asyncio.AbstractEventLoop, batch: List[Tuple]):
+        """
+        Move the next batch of events from the queue into batch
+        
+        A lone event is taken right away. When several arrive in the same
+        loop iteration, collection continues for COALESCE_WINDOW seconds.
+        Events are added as they are taken, so the caller still holds them
+        if collection is cancelled.
+        """
+        batch.append(self._queue.get_nowait())
+        
+        # Let producers scheduled in this loop iteration enqueue first
+        await asyncio.sleep(0)
+        while len(batch) < self.MAX_BATCH_SIZE and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        
+        if len(batch) > 1:
+            deadline = loop.time() + self.COALESCE_WINDOW
+            while len(batch) < self.MAX_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+    
+    def _drain_queue(self, batch: List[Tuple]):
+        """Move every event still queued into batch"""
+        if self._queue is not None:
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+    
+    async def _dispatch_batch(self, batch: List[Tuple]):
+        """Send each distinct event of a batch once and resolve its waiters"""
+        groups: Dict[Tuple[str, str, str], List[Any]] = {}
+        for event_type, context, priority, future in batch:
+            key = (event_type.value, priority.value, context_fingerprint(context))
+            if key in groups:
+                groups[key][3].append(future)
+            else:
+                groups[key] = [event_type, context, priority, [future]]
+        
+        outcomes = await asyncio.gather(
+            *(
+                self.notification_service.send_notification(event_type, context, priority)
+                for event_type, context, priority, _ in groups.values()
+            ),
+            return_exceptions=True
+        )
+        for (_, _, _, futures), outcome in zip(groups.values(), outcomes):
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+    
+    async def __aenter__(self) -> 'PipelineEventHandler':
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Stop the background flusher and release notification resources"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        
+        # A flusher cancelled before it first ran never saw the queue
+        leftover: List[Tuple] = []
+        self._drain_queue(leftover)
+        _fail_waiters(leftover, _handler_closed_error())
+        await self.notification_service.aclose()
+    
     def _enhance_context(
         self, 
         context: Dict[str, Any], 
         event_type: NotificationEventType
-    ) -> Dict[str, Any]:
-        """Enhance context with additional computed information"""
+    ) -> Mapping[str, Any]:
+        """
+        Enhance context with additional computed information
+        
+        The computed fields are layered over the caller's context with a
+        ChainMap instead of copying it.
+        """
         
-        enhanced = context.copy()
+        additions: Dict[str, Any] = {}
         
         # Add timestamp if not present
-        if "timestamp" not in enhanced:
-            enhanced["timestamp"] = datetime.now(timezone.utc).isoformat()
+        if "timestamp" not in context:
+            additions["timestamp"] = datetime.now(timezone.utc).isoformat()
         
         # Add duration if we have start/end times
-        if "start_time" in enhanced and "end_time" in enhanced:
-            start_time = datetime.fromisoformat(enhanced["start_time"].replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(enhanced["end_time"].replace('Z', '+00:00'))
+        if "start_time" in context and "end_time" in context:
+            start_time = _parse_iso(context["start_time"])
+            end_time = _parse_iso(context["end_time"])
             duration = end_time - start_time
-            enhanced["duration"] = self._format_duration(duration.total_seconds())
+            additions["duration"] = _format_duration(duration.total_seconds())
         
         # Add pipeline URL if we can construct it
-        if "project" in enhanced and "aws_region" in enhanced:
-            enhanced["pipeline_url"] = self._construct_pipeline_url(
-                enhanced["project"], 
-                enhanced["aws_region"]
+        if "project" in context and "aws_region" in context:
+            additions["pipeline_url"] = _construct_pipeline_url(
+                context["project"], 
+                context["aws_region"]
             )
         
         # Add logs URL if we can construct it
-        if "job_id" in enhanced and "aws_region" in enhanced:
-            enhanced["logs_url"] = self._construct_logs_url(
-                enhanced["job_id"],
-                enhanced["aws_region"]
+        if "job_id" in context and "aws_region" in context:
+            additions["logs_url"] = _construct_logs_url(
+                context["job_id"],
+                context["aws_region"]
             )
         
         # Truncate commit hash for display
-        if "commit" in enhanced and len(enhanced["commit"]) > 8:
-            enhanced["commit"] = enhanced["commit"][:8]
+        if "commit" in context and len(context["commit"]) > 8:
+            additions["commit"] = context["commit"][:8]
         
         # Add author from commit if available
-        if "commit_author" in enhanced:
-            enhanced["author"] = enhanced["commit_author"]
+        if "commit_author" in context:
+            additions["author"] = context["commit_author"]
         
-        return enhanced
-    
-    def _format_duration(self, seconds: float) -> str:
-        """Format duration in human-readable format"""
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            remaining_seconds = int(seconds % 60)
-            return f"{minutes}m {remaining_seconds}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m"
-    
-    def _construct_pipeline_url(self, project_name: str, aws_region: str) -> str:
-        """Construct AWS CodePipeline URL"""
-        return f"https://console.aws.amazon.com/codesuite/codepipeline/pipelines/{project_name}-pipeline/view?region={aws_region}"
-    
-    def _construct_logs_url(self, job_id: str, aws_region: str) -> str:
-        """Construct AWS CloudWatch logs URL"""
-        return f"https://console.aws.amazon.com/cloudwatch/home?region={aws_region}#logsV2:log-groups/log-group//aws/codebuild/{job_id}"
+        return ChainMap(additions, context)
     
     def track_pipeline_start(
         self, 
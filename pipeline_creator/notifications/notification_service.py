@@ -3,7 +3,7 @@ Notification Service - Core notification handling
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
 from enum import Enum
 import json
 from datetime import datetime
@@ -34,6 +34,35 @@ class NotificationPriority(Enum):
     CRITICAL = "critical"
 
 
+# Default rules if not configured; merged under the user's rules, never mutated
+_DEFAULT_RULES = {
+    "notify_on_success": False,  # Only notify on first success after failure
+    "notify_on_failure": True,   # Always notify on failure
+    "notify_on_recovery": True,  # Always notify on recovery
+    "quiet_hours": {
+        "enabled": False,
+        "start": "22:00",
+        "end": "08:00",
+        "timezone": "UTC"
+    }
+}
+
+
+def context_fingerprint(context: Mapping[str, Any]) -> str:
+    """
+    Canonical JSON form of an event context, used to spot repeated events
+    
+    The timestamp is left out, since otherwise identical events always
+    differ by it.
+    """
+    # Keys are stringified first so that mixed key types still sort
+    return json.dumps(
+        {str(key): value for key, value in context.items() if key != "timestamp"},
+        sort_keys=True,
+        default=str
+    )
+
+
 class NotificationService:
     """Main notification service orchestrator"""
     
@@ -76,7 +105,7 @@ class NotificationService:
     async def send_notification(
         self, 
         event_type: NotificationEventType,
-        context: Dict[str, Any],
+        context: Mapping[str, Any],
         priority: NotificationPriority = NotificationPriority.NORMAL,
         channels: Optional[List[str]] = None
     ) -> Dict[str, bool]:
@@ -90,7 +119,8 @@ class NotificationService:
             channels: Specific channels to send to (None = all configured)
         
         Returns:
-            Dict with channel names and success status
+            Dict with channel names and success status; channels that
+            suppressed the message as a duplicate are left out
         """
         if not self._should_notify(event_type, context):
             return {}
@@ -100,14 +130,26 @@ class NotificationService:
         
         # Determine channels to use
         target_channels = channels or list(self.channels.keys())
+        active_channels = [
+            (channel_name, self.channels[channel_name])
+            for channel_name in target_channels
+            if channel_name in self.channels and self.channels[channel_name].is_enabled()
+        ]
+        if not active_channels:
+            return {}
+        
+        # Format once, only now that some channel will send
+        try:
+            message = self._format_message(event_type, context, priority)
+        except Exception as e:
+            print_error(f"Error formatting notification: {str(e)}")
+            return {channel_name: False for channel_name, _ in active_channels}
         
         # Send notifications concurrently
-        tasks = []
-        for channel_name in target_channels:
-            if channel_name in self.channels:
-                channel = self.channels[channel_name]
-                task = self._send_to_channel(channel, event_type, context, priority)
-                tasks.append((channel_name, task))
+        tasks = [
+            (channel_name, self._send_to_channel(channel, message, event_type, priority))
+            for channel_name, channel in active_channels
+        ]
         
         # Execute all notifications concurrently
         results = {}
@@ -115,22 +157,25 @@ class NotificationService:
             task_results = await asyncio.gather(*[task[1] for task in tasks], return_exceptions=True)
             for i, (channel_name, _) in enumerate(tasks):
                 result = task_results[i]
-                results[channel_name] = not isinstance(result, Exception)
                 if isinstance(result, Exception):
                     print_error(f"Failed to send notification to {channel_name}: {str(result)}")
+                    results[channel_name] = False
+                elif result is not None:
+                    # None marks a suppressed duplicate, which is neither a
+                    # delivery nor a failure
+                    results[channel_name] = result
         
         return results
     
     async def _send_to_channel(
         self,
         channel,
+        message: Dict[str, Any],
         event_type: NotificationEventType,
-        context: Dict[str, Any],
         priority: NotificationPriority
-    ) -> bool:
-        """Send notification to a specific channel"""
+    ) -> Optional[bool]:
+        """Send a formatted notification to a specific channel"""
         try:
-            message = self._format_message(event_type, context, priority)
             success = await channel.send(message, event_type, priority)
             return success
         except Exception as e:
@@ -143,21 +188,8 @@ class NotificationService:
         # Get notification rules
         rules = self.notification_config.get("rules", {})
         
-        # Default rules if not configured
-        default_rules = {
-            "notify_on_success": False,  # Only notify on first success after failure
-            "notify_on_failure": True,   # Always notify on failure
-            "notify_on_recovery": True,  # Always notify on recovery
-            "quiet_hours": {
-                "enabled": False,
-                "start": "22:00",
-                "end": "08:00",
-                "timezone": "UTC"
-            }
-        }
-        
         # Merge with user rules
-        effective_rules = {**default_rules, **rules}
+        effective_rules = {**_DEFAULT_RULES, **rules}
         
         # Check quiet hours
         if self._is_quiet_hours(effective_rules.get("quiet_hours", {})):
@@ -233,6 +265,13 @@ class NotificationService:
         
         return self.templates.format_message(event_type, context, priority)
     
+    async def aclose(self):
+        """Release network resources held by the channels"""
+        if self.channels:
+            from .channels import close_http_session
+            await asyncio.gather(*(channel.aclose() for channel in self.channels.values()))
+            await close_http_session()
+    
     def get_status(self) -> Dict[str, Any]:
         """Get notification service status"""
         return {
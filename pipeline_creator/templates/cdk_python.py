@@ -2,6 +2,9 @@
 CDK Python App template for Pipeline Creator
 """
 
+import string
+from typing import Any, Mapping
+
 CDK_APP_TEMPLATE = '''#!/usr/bin/env python3
 import os
 import aws_cdk as cdk
@@ -266,4 +269,49 @@ The pipeline is configured based on `.pipeline/config.json` in your project root
 
 Environment: {environment}
 Region: {aws_region}
-'''
\ No newline at end of file
+'''
+
+
+class CompiledTemplate:
+    """
+    A str.format template parsed once into literal text and field names
+    
+    Rendering joins the pre-split segments instead of re-parsing the
+    template on every call. Only plain {field} replacements are supported,
+    which is all the CDK templates use.
+    """
+    
+    def __init__(self, template: str):
+        self.template = template
+        self._segments = []
+        for literal, field, format_spec, conversion in string.Formatter().parse(template):
+            if format_spec or conversion:
+                raise ValueError(f"Unsupported replacement field: {{{field}}}")
+            self._segments.append((literal, field))
+    
+    def render(self, values: Mapping[str, Any]) -> str:
+        """
+        Render the template
+        
+        Args:
+            values: Replacement values by field name
+            
+        Returns:
+            Rendered text, identical to template.format(**values)
+        """
+        parts = []
+        for literal, field in self._segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(format(values[field]))
+        return ''.join(parts)
+
+
+# Files without replacement fields, encoded once. cdk.json is written as
+# the formatted template so its escaped {{ }} braces become real braces.
+CDK_JSON_BYTES = CDK_JSON_TEMPLATE.format().encode('utf-8')
+REQUIREMENTS_BYTES = REQUIREMENTS_TEMPLATE.encode('utf-8')
+
+CDK_APP = CompiledTemplate(CDK_APP_TEMPLATE)
+PIPELINE_STACK = CompiledTemplate(PIPELINE_STACK_TEMPLATE)
+README = CompiledTemplate(README_TEMPLATE)
\ No newline at end of file
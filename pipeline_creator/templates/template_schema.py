@@ -3,6 +3,7 @@ Template Schema Definition - Structure and validation for pipeline templates
 """
 
 from enum import Enum
+from functools import cached_property
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 import json
@@ -90,6 +91,11 @@ class TemplateSchema:
     extends: Optional[str] = None  # Base template to extend
     requirements: Optional[List[str]] = None  # Required tools/services
     
+    @cached_property
+    def tags_display(self) -> str:
+        """Comma-separated tags for display, joined on first use"""
+        return ', '.join(self.tags)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TemplateSchema':
         """Create schema from dictionary"""
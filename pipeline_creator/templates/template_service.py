@@ -4,11 +4,10 @@ Template Service - Integration between templates and pipeline creation
 
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-import json
-
 from .template_manager import TemplateManager, Template
 from .template_schema import TemplateCategory, TemplateValidationError
 from ..utils.console import print_error, print_success, print_info, print_warning
+from ..utils import json_utils
 
 
 class TemplateService:
@@ -25,12 +24,14 @@ class TemplateService:
         self,
         template_name: str,
         project_path: Path,
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        template: Optional[Template] = None
     ) -> bool:
         """Apply template to create pipeline configuration"""
         try:
-            # Get template
-            template = self.template_manager.get_template(template_name)
+            # Get template, unless the caller already loaded it
+            if template is None:
+                template = self.template_manager.get_template(template_name)
             if not template:
                 print_error(f"❌ Template '{template_name}' not found")
                 return False
@@ -46,8 +47,7 @@ class TemplateService:
             
             # Merge with existing config if it exists
             if pipeline_config_file.exists():
-                with open(pipeline_config_file) as f:
-                    existing_config = json.load(f)
+                existing_config = json_utils.loads(pipeline_config_file.read_bytes())
                 
                 # Merge configurations (template config takes precedence)
                 merged_config = self._merge_configs(existing_config, config)
@@ -63,8 +63,7 @@ class TemplateService:
             }
             
             # Save configuration
-            with open(pipeline_config_file, 'w') as f:
-                json.dump(merged_config, f, indent=2)
+            pipeline_config_file.write_bytes(json_utils.dumps(merged_config))
             
             print_success(f"✅ Template '{template_name}' applied successfully!")
             print_info(f"📄 Pipeline configuration saved to: {pipeline_config_file}")
@@ -97,8 +96,7 @@ class TemplateService:
                 return False
             
             # Load existing configuration
-            with open(pipeline_config_file) as f:
-                config = json.load(f)
+            config = json_utils.loads(pipeline_config_file.read_bytes())
             
             # Remove template metadata if it exists
             if 'template' in config:
@@ -8,10 +8,98 @@ import boto3
 import subprocess
 import json
 import os
+import threading
+import time
 from botocore.exceptions import ClientError, NoCredentialsError
 from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 
+from . import json_utils
+from .file_utils import resolve_executable
+
+# On-disk cache of CLI tool versions, shared between invocations
+TOOL_VERSIONS_CACHE = Path.home() / ".cache" / "pipeline-creator" / "tool-versions.json"
+TOOL_VERSIONS_TTL = 24 * 60 * 60
+
+# How long a successful STS caller identity is reused within a process
+CALLER_IDENTITY_TTL = 60
+
+# One lock per cache, held while its value is fetched so concurrent callers
+# share a single STS call or cdk run without blocking on each other's I/O
+_caller_identity_lock = threading.Lock()
+_cdk_version_lock = threading.Lock()
+_caller_identity: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def _get_caller_identity() -> Dict[str, Any]:
+    """
+    Get the STS caller identity, reusing a recent successful response
+    
+    Returns:
+        STS get_caller_identity response
+    
+    Raises:
+        NoCredentialsError, ClientError: If the identity cannot be fetched
+    """
+    global _caller_identity
+    
+    with _caller_identity_lock:
+        if _caller_identity and time.monotonic() - _caller_identity[0] < CALLER_IDENTITY_TTL:
+            return _caller_identity[1]
+        
+        session = boto3.Session()
+        sts = session.client('sts')
+        response = sts.get_caller_identity()
+        _caller_identity = (time.monotonic(), response)
+        return response
+
+
+def _get_cached_cdk_version() -> Optional[str]:
+    """
+    Get the CDK CLI version, cached on disk per cdk executable
+    
+    The cache entry is keyed on the resolved executable path, mtime and size,
+    so upgrading or replacing the CLI invalidates it.
+    
+    Returns:
+        CDK version string or None if CDK is not available
+    """
+    try:
+        cdk_path = resolve_executable('cdk')
+        stat = os.stat(cdk_path)
+    except OSError:
+        return None
+    key = f"{cdk_path}:{stat.st_mtime_ns}:{stat.st_size}"
+    
+    with _cdk_version_lock:
+        try:
+            cache = json_utils.loads(TOOL_VERSIONS_CACHE.read_bytes())
+        except (OSError, ValueError):
+            cache = {}
+        
+        entry = cache.get('cdk')
+        if (isinstance(entry, dict) and entry.get('key') == key
+                and time.time() - entry.get('checked_at', 0) < TOOL_VERSIONS_TTL):
+            return entry.get('version')
+        
+        try:
+            result = subprocess.run([cdk_path, '--version'],
+                                  capture_output=True, text=True, timeout=10)
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+            return None
+        if result.returncode != 0:
+            return None
+        
+        version = result.stdout.strip()
+        cache['cdk'] = {'key': key, 'version': version, 'checked_at': time.time()}
+        try:
+            TOOL_VERSIONS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            TOOL_VERSIONS_CACHE.write_bytes(json_utils.dumps(cache))
+        except OSError:
+            pass
+        
+        return version
+
 
 def check_aws_credentials() -> bool:
     """
@@ -21,10 +109,7 @@ def check_aws_credentials() -> bool:
         True if credentials are available, False otherwise
     """
     try:
-        # Try to create a session and get caller identity
-        session = boto3.Session()
-        sts = session.client('sts')
-        sts.get_caller_identity()
+        _get_caller_identity()
         return True
     except (NoCredentialsError, ClientError):
         return False
@@ -38,9 +123,7 @@ def get_aws_account_info() -> Optional[Dict[str, str]]:
         Dictionary with account ID and user info, or None if not available
     """
     try:
-        session = boto3.Session()
-        sts = session.client('sts')
-        response = sts.get_caller_identity()
+        response = _get_caller_identity()
         
         return {
             'account_id': response.get('Account'),
@@ -58,12 +141,7 @@ def check_cdk_installed() -> bool:
     Returns:
         True if CDK is installed, False otherwise
     """
-    try:
-        result = subprocess.run(['cdk', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-        return False
+    return _get_cached_cdk_version() is not None
 
 
 def get_cdk_version() -> Optional[str]:
@@ -73,14 +151,7 @@ def get_cdk_version() -> Optional[str]:
     Returns:
         CDK version string or None if not available
     """
-    try:
-        result = subprocess.run(['cdk', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-        return None
+    return _get_cached_cdk_version()
 
 
 def check_cdk_bootstrap(region: str) -> Tuple[bool, Optional[str]]:
@@ -126,7 +197,7 @@ def bootstrap_cdk(region: str) -> Tuple[bool, Optional[str]]:
     """
     try:
         result = subprocess.run([
-            'cdk', 'bootstrap', 
+            resolve_executable('cdk'), 'bootstrap', 
             f'aws://unknown-account/{region}'
         ], capture_output=True, text=True, timeout=300)
         
@@ -2,28 +2,91 @@
 Configuration utilities for Pipeline Creator
 """
 
+import copy
+import functools
 import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from .console import print_error, print_warning
+from . import json_utils
+from .file_utils import write_bytes_atomic
+
+
+# Relative to the working directory, so resolving it needs no getcwd() call
+CONFIG_PATH = Path(".pipeline") / "config.json"
+_CONFIG_PATH_STR = os.path.join(".pipeline", "config.json")
+
+
+class ConfigNotFoundError(FileNotFoundError):
+    """Exception raised when the pipeline configuration file does not exist"""
+    pass
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """Top-level pipeline settings read once from the configuration"""
+    project_name: str
+    environment: str
+    aws_region: str
+    extra_stages: tuple = ()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], environment: Optional[str] = None,
+                  region: Optional[str] = None) -> 'PipelineConfig':
+        """
+        Create settings from a configuration dictionary
+        
+        Args:
+            data: Configuration dictionary
+            environment: Optional environment overriding the configured one
+            region: Optional AWS region overriding the configured one
+        
+        Returns:
+            PipelineConfig instance
+        
+        Raises:
+            KeyError: If a required setting is missing
+        """
+        return cls(
+            project_name=data['project_name'],
+            environment=environment or data['environment'],
+            aws_region=region or data['aws_region'],
+            extra_stages=tuple(data.get('extra_stages', ()))
+        )
 
 
 def get_config_path() -> Path:
     """Get the path to the pipeline configuration file"""
-    return Path(".pipeline/config.json")
+    return CONFIG_PATH
 
 
 def check_config_exists() -> bool:
     """Check if pipeline configuration exists"""
-    return get_config_path().exists()
+    return os.path.isfile(_CONFIG_PATH_STR)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path: str, device: int, inode: int, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a configuration file, memoized on its stat signature
+    
+    The device, inode, mtime and size arguments are only part of the cache
+    key, so a rewritten or replaced file is always parsed again.
+    """
+    return json_utils.loads(Path(path).read_bytes())
 
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load pipeline configuration from JSON file
     
+    Repeated loads of an unchanged file within the same process reuse the
+    cached parse without reading the file again. Each call gets its own copy,
+    so callers may modify the result freely.
+    
     Args:
         config_path: Optional path to config file, defaults to .pipeline/config.json
     
@@ -31,7 +94,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         Configuration dictionary
     
     Raises:
-        FileNotFoundError: If config file doesn't exist
+        ConfigNotFoundError: If config file doesn't exist
         json.JSONDecodeError: If config file is invalid JSON
     """
     if config_path:
@@ -39,13 +102,15 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     else:
         config_file = get_config_path()
     
-    if not config_file.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_file}")
+    try:
+        stat = config_file.stat()
+    except FileNotFoundError:
+        raise ConfigNotFoundError(f"Configuration file not found: {config_file}") from None
     
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        return config
+        return copy.deepcopy(_parse_config(
+            str(config_file), stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+        ))
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Invalid JSON in configuration file: {str(e)}", e.doc, e.pos)
 
@@ -66,13 +131,15 @@ def save_config(config: Dict[str, Any], config_path: Optional[str] = None) -> bo
     else:
         config_file = get_config_path()
     
+    # Callers mutate the loaded dict before saving, so never serve it again
+    _parse_config.cache_clear()
+    
     try:
         # Create directory if it doesn't exist
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save configuration
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # Never leave a truncated config behind if the save is interrupted
+        write_bytes_atomic(config_file, json_utils.dumps(config))
         
         return True
     except Exception as e:
@@ -261,8 +328,7 @@ def restore_config(backup_path: str, config_path: Optional[str] = None) -> bool:
     
     try:
         # Validate backup file is valid JSON
-        with open(backup_file, 'r', encoding='utf-8') as f:
-            json.load(f)
+        json_utils.loads(backup_file.read_bytes())
         
         # Copy backup to config location
         import shutil
@@ -9,6 +9,7 @@ from rich.console import Console
 from rich.text import Text
 from rich import print as rich_print
 import sys
+from typing import Any, Dict, Iterable, Optional
 
 console = Console()
 
@@ -45,6 +46,18 @@ def print_info(message: str) -> None:
     console.print(text)
 
 
+def print_info_lines(lines: Iterable[str]) -> None:
+    """Print several info messages in blue with a single console write"""
+    text = Text()
+    for line in lines:
+        if text:
+            text.append("\n")
+        text.append("ℹ️ ", style="bold blue")
+        text.append(str(line), style="blue")
+    if text:
+        console.print(text)
+
+
 def print_step(message: str, step_num: int = None) -> None:
     """Print a step message with optional numbering"""
     text = Text()
@@ -58,7 +71,7 @@ def print_step(message: str, step_num: int = None) -> None:
 def print_header(title: str) -> None:
     """Print a header with decorative formatting"""
     console.print()
-    console.rule(f"[bold cyan]{title}[/bold cyan]")
+    console.rule(Text(str(title), style="bold cyan"))
     console.print()
 
 
@@ -67,6 +80,74 @@ def print_json(data: dict) -> None:
     rich_print(data)
 
 
+def _form_validator(default):
+    """Build the questionary validator for a form field with the given default"""
+    if isinstance(default, int):
+        return lambda value: value.strip().isdigit() or "A number is required"
+    if default is None:
+        return lambda value: bool(value.strip()) or "A value is required"
+    return None
+
+
+def prompt_form(fields: Dict[str, str], defaults: Optional[Dict[str, Any]] = None,
+                secret: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Prompt for several text values
+    
+    When questionary is installed and the session is interactive, all fields
+    are asked in a single form. Otherwise each field is prompted with click.
+    
+    Args:
+        fields: Mapping of result key to prompt message
+        defaults: Optional mapping of result key to default value. Fields
+            without a default are required, and integer defaults make the
+            field an integer
+        secret: Keys whose input is hidden
+        
+    Returns:
+        Mapping of result key to the entered value
+    """
+    import click
+    
+    defaults = defaults or {}
+    secret = frozenset(secret)
+    
+    if sys.stdin.isatty() and sys.stdout.isatty():
+        try:
+            import questionary
+        except ImportError:
+            questionary = None
+        
+        if questionary is not None:
+            questions = {}
+            for key, message in fields.items():
+                default = defaults.get(key)
+                ask = questionary.password if key in secret else questionary.text
+                questions[key] = ask(
+                    message,
+                    default="" if default is None else str(default),
+                    validate=_form_validator(default)
+                )
+            answers = questionary.form(**questions).ask()
+            if answers is None:
+                raise click.Abort()
+            for key, value in answers.items():
+                if isinstance(defaults.get(key), int):
+                    answers[key] = int(value)
+            return answers
+    
+    answers = {}
+    for key, message in fields.items():
+        default = defaults.get(key)
+        answers[key] = click.prompt(
+            message,
+            default=default,
+            hide_input=key in secret,
+            type=int if isinstance(default, int) else str
+        )
+    return answers
+
+
 def confirm(message: str, default: bool = False) -> bool:
     """
     Ask user for confirmation
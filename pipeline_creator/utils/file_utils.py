@@ -4,11 +4,16 @@ File utility functions for Pipeline Creator CLI
 This module provides utility functions for file operations and validations.
 """
 
+import functools
 import json
 import os
+import shutil
+import stat
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from . import json_utils
+
 
 def ensure_directory(path: Path) -> None:
     """
@@ -31,11 +36,7 @@ def read_json_file(file_path: Path) -> Optional[Dict[str, Any]]:
         Parsed JSON data or None if file doesn't exist or is invalid
     """
     try:
-        if not file_path.exists():
-            return None
-            
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_utils.loads(file_path.read_bytes())
     except (json.JSONDecodeError, IOError):
         return None
 
@@ -54,13 +55,72 @@ def write_json_file(file_path: Path, data: Dict[str, Any], indent: int = 2) -> b
     """
     try:
         ensure_directory(file_path.parent)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        if indent == 2:
+            payload = json_utils.dumps(data)
+        else:
+            payload = json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+        file_path.write_bytes(payload)
         return True
     except IOError:
         return False
 
 
+def write_bytes_atomic(file_path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file atomically
+    
+    The data is written to a temporary file next to the target, flushed to
+    disk and renamed into place, so an interrupted write never leaves a
+    truncated file behind. The file keeps the permissions of the one it
+    replaces; a new file is readable by its owner only, since the config
+    holds credentials.
+    
+    Args:
+        file_path: Path to write
+        data: File contents
+    """
+    tmp_file = file_path.with_name(file_path.name + ".tmp")
+    try:
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        mode = 0o600
+    
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            os.chmod(tmp_file, mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_executable(name: str) -> str:
+    """
+    Resolve an executable on PATH once per process
+    
+    Args:
+        name: Executable name, e.g. 'cdk'
+        
+    Returns:
+        Absolute path to the executable
+        
+    Raises:
+        FileNotFoundError: If the executable is not on PATH
+    """
+    path = shutil.which(name)
+    if not path:
+        raise FileNotFoundError(f"Executable not found on PATH: {name}")
+    return path
+
+
 def is_git_repository() -> bool:
     """
     Check if current directory is a git repository
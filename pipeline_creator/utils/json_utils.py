@@ -0,0 +1,53 @@
+"""
+JSON helpers for Pipeline Creator CLI
+
+This module wraps the JSON encoder and decoder used for configuration files.
+orjson is used when it is installed (pip install pipeline-creator[fast]),
+otherwise the standard library json module is used with the same output.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON from bytes or str
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON bytes
+
+    Args:
+        obj: Data to serialize
+        indent: Pretty-print with two-space indentation and a trailing newline
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE if indent else 0
+        return orjson.dumps(obj, option=option)
+
+    if indent:
+        return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
\ No newline at end of file
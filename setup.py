@@ -50,10 +50,16 @@ setup(
             "flake8>=5.0.0",
             "mypy>=1.0.0",
         ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
+        "interactive": [
+            "questionary>=1.10.0",
+        ],
     },
     entry_points={
         "console_scripts": [
-            "pipeline=pipeline_creator.main:cli",
+            "pipeline=pipeline_creator.main:main",
         ],
     },
     include_package_data=True,
@@ -0,0 +1,14 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+import os
+
+
+@pytest.fixture(autouse=True)
+def restore_cwd():
+    """Return to the starting directory after tests that chdir into temp dirs"""
+    cwd = os.getcwd()
+    yield
+    os.chdir(cwd)
\ No newline at end of file
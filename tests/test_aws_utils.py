@@ -0,0 +1,91 @@
+"""
+Tests for AWS utility functions
+
+This module contains unit tests for the cached STS identity and CDK version lookups.
+"""
+
+import pytest
+import subprocess
+import sys
+import threading
+
+from pipeline_creator.utils import aws_utils
+
+
+class FakeSTS:
+    """STS client answering get_caller_identity from a callback"""
+    
+    def __init__(self, on_call):
+        self.on_call = on_call
+    
+    def get_caller_identity(self):
+        self.on_call()
+        return {"Account": "111111111111", "UserId": "AIDEXAMPLE", "Arn": "arn:aws:iam::111111111111:user/dev"}
+
+
+class TestPreflightCaches:
+    """Test class for the STS identity and CDK version caches"""
+    
+    @pytest.fixture(autouse=True)
+    def fakes(self, tmp_path, monkeypatch):
+        """Stub boto3 and the cdk executable"""
+        self.sts_calls = 0
+        self.cdk_runs = 0
+        self.on_sts_call = lambda: None
+        self.on_cdk_run = lambda: None
+        
+        def on_sts_call():
+            self.sts_calls += 1
+            self.on_sts_call()
+        
+        def run(command, **kwargs):
+            self.cdk_runs += 1
+            self.on_cdk_run()
+            return subprocess.CompletedProcess(command, 0, "2.100.0 (build abc)\n", "")
+        
+        monkeypatch.setattr(aws_utils, "_caller_identity", None)
+        monkeypatch.setattr(aws_utils.boto3, "Session", lambda: type("Session", (), {
+            "client": lambda self, name: FakeSTS(on_sts_call)
+        })())
+        monkeypatch.setattr(aws_utils, "TOOL_VERSIONS_CACHE", tmp_path / "tool-versions.json")
+        monkeypatch.setattr(aws_utils, "resolve_executable", lambda name: sys.executable)
+        monkeypatch.setattr(aws_utils.subprocess, "run", run)
+    
+    def test_identity_is_fetched_once(self):
+        """Test that the credentials and account checks share one STS call"""
+        assert aws_utils.check_aws_credentials() == True
+        assert aws_utils.get_aws_account_info()["account_id"] == "111111111111"
+        assert self.sts_calls == 1
+    
+    def test_cdk_version_is_cached_on_disk(self):
+        """Test that the CDK version is read from the cache file on later calls"""
+        assert aws_utils.get_cdk_version() == "2.100.0 (build abc)"
+        assert aws_utils.check_cdk_installed() == True
+        assert self.cdk_runs == 1
+    
+    def test_sts_and_cdk_lookups_run_concurrently(self):
+        """Test that a slow STS call does not hold up the CDK version lookup"""
+        sts_started = threading.Event()
+        cdk_started = threading.Event()
+        
+        def slow_sts_call():
+            sts_started.set()
+            cdk_started.wait(timeout=5)
+        
+        self.on_sts_call = slow_sts_call
+        self.on_cdk_run = cdk_started.set
+        
+        sts_thread = threading.Thread(target=aws_utils.check_aws_credentials)
+        sts_thread.start()
+        assert sts_started.wait(timeout=2)
+        
+        cdk_thread = threading.Thread(target=aws_utils.get_cdk_version)
+        cdk_thread.start()
+        
+        assert cdk_started.wait(timeout=2)
+        sts_thread.join()
+        cdk_thread.join()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
\ No newline at end of file
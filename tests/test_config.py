@@ -0,0 +1,146 @@
+"""
+Tests for configuration loading and saving
+
+This module contains unit tests for the cached config loader and the atomic save.
+"""
+
+import pytest
+import json
+import os
+import stat
+
+from pipeline_creator.utils import config as config_module
+from pipeline_creator.utils.config import load_config, save_config, ConfigNotFoundError
+from pipeline_creator.utils.file_utils import write_bytes_atomic
+
+
+class TestConfigCache:
+    """Test class for the stat-keyed configuration cache"""
+    
+    def setup_method(self):
+        """Start each test with an empty parse cache"""
+        config_module._parse_config.cache_clear()
+    
+    def test_load_missing_config(self, tmp_path):
+        """Test that a missing file raises ConfigNotFoundError"""
+        with pytest.raises(ConfigNotFoundError):
+            load_config(str(tmp_path / "missing.json"))
+    
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Test that repeated loads of an unchanged file hit the cache"""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"project_name": "cached"}))
+        
+        first = load_config(str(config_path))
+        second = load_config(str(config_path))
+        
+        assert first == second == {"project_name": "cached"}
+        assert second is not first
+        assert config_module._parse_config.cache_info().misses == 1
+    
+    def test_unsaved_changes_do_not_leak(self, tmp_path):
+        """Test that modifying a loaded config does not affect later loads"""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"project_name": "cached", "stages": {"build": {}}}))
+        
+        config = load_config(str(config_path))
+        config["project_name"] = "changed"
+        config["stages"]["build"]["image"] = "python:3.12"
+        
+        assert load_config(str(config_path)) == {"project_name": "cached", "stages": {"build": {}}}
+    
+    def test_external_rewrite_is_reloaded(self, tmp_path):
+        """Test that a file changed behind the cache's back is parsed again"""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"project_name": "before"}))
+        load_config(str(config_path))
+        
+        config_path.write_text(json.dumps({"project_name": "after-rewrite"}))
+        
+        assert load_config(str(config_path))["project_name"] == "after-rewrite"
+    
+    def test_save_config_invalidates_cache(self, tmp_path):
+        """Test that a load after save_config returns the saved values"""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"project_name": "old"}))
+        
+        config = load_config(str(config_path))
+        config["project_name"] = "new"
+        assert save_config(config, str(config_path))
+        
+        reloaded = load_config(str(config_path))
+        assert reloaded == {"project_name": "new"}
+        assert reloaded is not config
+    
+    def test_save_config_creates_directory(self, tmp_path):
+        """Test that save_config creates the parent directory"""
+        config_path = tmp_path / ".pipeline" / "config.json"
+        
+        assert save_config({"project_name": "fresh"}, str(config_path))
+        assert json.loads(config_path.read_text()) == {"project_name": "fresh"}
+
+
+class TestAtomicSave:
+    """Test class for the atomic configuration save"""
+    
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        """Test that a successful save replaces the file and cleans up"""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"project_name": "old"}))
+        
+        assert save_config({"project_name": "new"}, str(config_path))
+        
+        assert json.loads(config_path.read_text()) == {"project_name": "new"}
+        assert os.listdir(tmp_path) == ["config.json"]
+    
+    def test_interrupted_save_keeps_original(self, tmp_path, monkeypatch):
+        """Test that a failed save leaves the previous config intact"""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"project_name": "original"}))
+        
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(os, "replace", fail_replace)
+        
+        assert save_config({"project_name": "lost"}, str(config_path)) == False
+        assert json.loads(config_path.read_text()) == {"project_name": "original"}
+        assert os.listdir(tmp_path) == ["config.json"]
+
+
+class TestAtomicWrite:
+    """Test class for write_bytes_atomic"""
+    
+    def test_write_replaces_contents(self, tmp_path):
+        """Test that the target ends up with the new contents and no temp file"""
+        target = tmp_path / ".last-deploy-hash"
+        target.write_bytes(b"old contents")
+        
+        write_bytes_atomic(target, b"new")
+        
+        assert target.read_bytes() == b"new"
+        assert os.listdir(tmp_path) == [".last-deploy-hash"]
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_keeps_file_mode(self, tmp_path):
+        """Test that a replaced file keeps its permissions"""
+        target = tmp_path / "config.json"
+        target.write_bytes(b"{}")
+        os.chmod(target, 0o640)
+        
+        write_bytes_atomic(target, b'{"smtp_password": "secret"}')
+        
+        assert stat.S_IMODE(os.stat(target).st_mode) == 0o640
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_new_file_is_private(self, tmp_path):
+        """Test that a newly created file is readable by its owner only"""
+        target = tmp_path / "config.json"
+        
+        write_bytes_atomic(target, b"{}")
+        
+        assert stat.S_IMODE(os.stat(target).st_mode) == 0o600
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+Tests for console helpers
+
+This module contains unit tests for the prompt form helper.
+"""
+
+import pytest
+import click
+from click.testing import CliRunner
+
+from pipeline_creator.utils.console import prompt_form
+
+
+class TestPromptForm:
+    """Test class for the prompt form fallback"""
+    
+    def test_prompts_each_field(self):
+        """Test that each field is prompted in order when not on a terminal"""
+        @click.command()
+        def form():
+            click.echo(repr(prompt_form({"host": "SonarQube URL", "token": "SonarQube token"})))
+        
+        result = CliRunner().invoke(form, input="https://sonar.example.com\nsqp_123\n")
+        
+        assert result.exit_code == 0
+        assert "{'host': 'https://sonar.example.com', 'token': 'sqp_123'}" in result.output
+    
+    def test_required_field_prompts_again(self):
+        """Test that an empty answer is asked again"""
+        @click.command()
+        def form():
+            click.echo(repr(prompt_form({"name": "Stage name"})))
+        
+        result = CliRunner().invoke(form, input="\nsonarqube\n")
+        
+        assert result.exit_code == 0
+        assert "{'name': 'sonarqube'}" in result.output
+    
+    def test_defaults_and_secret_fields(self):
+        """Test that defaults are accepted and secret input is not echoed"""
+        @click.command()
+        def form():
+            answers = prompt_form(
+                {"url": "Webhook URL", "port": "SMTP port", "password": "Password"},
+                defaults={"port": 587},
+                secret=["password"]
+            )
+            click.echo(repr(answers))
+        
+        result = CliRunner().invoke(form, input="https://example.com/hook\n\nhunter2\n")
+        
+        assert result.exit_code == 0
+        assert "{'url': 'https://example.com/hook', 'port': 587, 'password': 'hunter2'}" in result.output
+        assert "hunter2" not in result.output.split("{")[0]
+    
+    def test_integer_default_rejects_text(self):
+        """Test that a field with an integer default only accepts integers"""
+        @click.command()
+        def form():
+            click.echo(repr(prompt_form({"port": "SMTP port"}, defaults={"port": 587})))
+        
+        result = CliRunner().invoke(form, input="abc\n25\n")
+        
+        assert result.exit_code == 0
+        assert "{'port': 25}" in result.output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
\ No newline at end of file
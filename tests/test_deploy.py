@@ -0,0 +1,186 @@
+"""
+Tests for the deploy command
+
+This module contains unit tests for skipping unchanged deployments and for
+running CDK commands.
+"""
+
+import pytest
+import json
+import os
+import sys
+import time
+from click.testing import CliRunner
+
+from pipeline_creator.commands import deploy as deploy_module
+from pipeline_creator.commands.deploy import deploy_command, LAST_DEPLOY_HASH_FILE
+from pipeline_creator.commands.init import get_default_config
+from pipeline_creator.utils import aws_utils
+
+
+class TestDeployHashSkip:
+    """Test class for the deploy-hash skip and re-deploy paths"""
+    
+    @pytest.fixture(autouse=True)
+    def project(self, tmp_path, monkeypatch):
+        """Set up a project with generated CDK files and stubbed AWS calls"""
+        monkeypatch.chdir(tmp_path)
+        
+        pipeline_dir = tmp_path / ".pipeline"
+        pipeline_dir.mkdir()
+        config = get_default_config()
+        config.update({"project_name": "demo", "aws_region": "us-east-1", "environment": "dev"})
+        (pipeline_dir / "config.json").write_text(json.dumps(config))
+        
+        cdk_dir = tmp_path / "cdk"
+        cdk_dir.mkdir()
+        (cdk_dir / "app.py").write_text("print('app')\n")
+        (cdk_dir / "cdk.json").write_text("{}")
+        
+        self.account = {"account_id": "111111111111"}
+        self.cdk_commands = []
+        
+        def run_cdk_command(command, cwd, timeout=600):
+            self.cdk_commands.append(command[1])
+            return True, ""
+        
+        monkeypatch.setattr(aws_utils, "check_aws_credentials", lambda: True)
+        monkeypatch.setattr(aws_utils, "get_aws_account_info", lambda: self.account)
+        monkeypatch.setattr(aws_utils, "check_cdk_installed", lambda: True)
+        monkeypatch.setattr(aws_utils, "get_cdk_version", lambda: "2.0.0")
+        monkeypatch.setattr(aws_utils, "check_cdk_bootstrap", lambda region: (True, None))
+        monkeypatch.setattr(deploy_module, "install_cdk_dependencies", lambda cdk_dir: True)
+        monkeypatch.setattr(deploy_module, "run_cdk_command", run_cdk_command)
+        
+        self.runner = CliRunner()
+        self.cdk_dir = cdk_dir
+        self.hash_path = pipeline_dir / LAST_DEPLOY_HASH_FILE
+    
+    def deploy(self, *args):
+        """Run the deploy command and return its output"""
+        result = self.runner.invoke(deploy_command, ['-y', *args])
+        assert result.exit_code == 0, result.output
+        return result.output
+    
+    def test_first_deploy_records_hash(self):
+        """Test that a successful deploy writes the deploy hash"""
+        self.deploy()
+        
+        assert self.cdk_commands == ["diff", "deploy"]
+        assert self.hash_path.exists()
+    
+    def test_unchanged_deploy_is_skipped(self):
+        """Test that a second deploy with no changes is skipped"""
+        self.deploy()
+        output = self.deploy()
+        
+        assert "No changes since last deploy" in output
+        assert self.cdk_commands == ["diff", "deploy"]
+    
+    def test_force_redeploys(self):
+        """Test that --force deploys even when nothing changed"""
+        self.deploy()
+        self.deploy('--force')
+        
+        assert self.cdk_commands.count("deploy") == 2
+    
+    def test_changed_cdk_file_redeploys(self):
+        """Test that editing a CDK file triggers a new deploy"""
+        self.deploy()
+        (self.cdk_dir / "app.py").write_text("print('changed app')\n")
+        self.deploy()
+        
+        assert self.cdk_commands.count("deploy") == 2
+    
+    def test_other_environment_redeploys(self):
+        """Test that overriding the environment triggers a new deploy"""
+        self.deploy()
+        self.deploy('-e', 'prod')
+        
+        assert self.cdk_commands.count("deploy") == 2
+    
+    def test_other_account_redeploys(self):
+        """Test that the same inputs aimed at another account are deployed"""
+        self.deploy()
+        self.account = {"account_id": "222222222222"}
+        self.deploy()
+        
+        assert self.cdk_commands.count("deploy") == 2
+    
+    def test_unknown_account_always_deploys(self):
+        """Test that nothing is skipped or recorded without an account id"""
+        self.account = None
+        self.deploy()
+        self.deploy()
+        
+        assert self.cdk_commands.count("deploy") == 2
+        assert not self.hash_path.exists()
+    
+    def test_failed_deploy_records_nothing(self, monkeypatch):
+        """Test that a failed deploy does not record a hash"""
+        monkeypatch.setattr(deploy_module, "run_cdk_command", lambda command, cwd, timeout=600: (False, "boom"))
+        self.deploy()
+        
+        assert not self.hash_path.exists()
+
+
+
+# Starts a child that ignores SIGTERM and inherits stdout, then sleeps
+SPAWN_CHILD = (
+    "import subprocess, sys, time\n"
+    "subprocess.Popen([sys.executable, '-c', "
+    "'import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(30)'])\n"
+    "print('started', flush=True)\n"
+    "time.sleep({sleep})\n"
+)
+
+
+class TestRunCdkCommand:
+    """Test class for streaming and stopping CDK commands"""
+    
+    @pytest.fixture(autouse=True)
+    def short_grace(self, monkeypatch):
+        """Shorten the wait between SIGTERM and SIGKILL"""
+        monkeypatch.setattr(deploy_module, "KILL_GRACE_PERIOD", 0.5)
+    
+    def run(self, code, tmp_path, timeout=10):
+        """Run Python code as a CDK command and time it"""
+        started = time.perf_counter()
+        result = deploy_module.run_cdk_command([sys.executable, "-c", code], tmp_path, timeout=timeout)
+        return result, time.perf_counter() - started
+    
+    def test_output_is_returned(self, tmp_path):
+        """Test that a finished command returns its status and output"""
+        (success, output), _ = self.run("print('one'); print('two')", tmp_path)
+        
+        assert success == True
+        assert output == "one\ntwo"
+    
+    def test_failure_is_reported(self, tmp_path):
+        """Test that a non-zero exit status fails the command"""
+        (success, output), _ = self.run("import sys; print('boom'); sys.exit(3)", tmp_path)
+        
+        assert success == False
+        assert output == "boom"
+    
+    @pytest.mark.skipif(os.name == 'nt', reason="process groups are POSIX only")
+    def test_timeout_stops_children(self, tmp_path):
+        """Test that a timed-out command and a child holding its output are stopped"""
+        (success, output), elapsed = self.run(SPAWN_CHILD.format(sleep=30), tmp_path, timeout=1)
+        
+        assert success == False
+        assert "timed out" in output
+        assert elapsed < 5
+    
+    @pytest.mark.skipif(os.name == 'nt', reason="process groups are POSIX only")
+    def test_lingering_child_times_out(self, tmp_path):
+        """Test that a child keeping the output open after the command exits does not hang"""
+        (success, output), elapsed = self.run(SPAWN_CHILD.format(sleep=0), tmp_path, timeout=1)
+        
+        assert success == False
+        assert "timed out" in output
+        assert elapsed < 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
\ No newline at end of file
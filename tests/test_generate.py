@@ -0,0 +1,128 @@
+"""
+Tests for the generate command helpers
+
+This module contains unit tests for name conversion and repository detection.
+"""
+
+import pytest
+import itertools
+import subprocess
+
+from pipeline_creator.commands import generate as generate_module
+from pipeline_creator.commands.generate import (
+    to_snake_case, to_pascal_case, read_origin_url, detect_repository_info, _GITHUB_URL_RE
+)
+
+
+def regex_snake_case(name: str) -> str:
+    """snake_case conversion as it was done with the two regex patterns"""
+    return generate_module._to_snake_case_regex(name.replace('-', '_'))
+
+
+class TestSnakeCase:
+    """Test class for the single-pass snake_case conversion"""
+    
+    @pytest.mark.parametrize("name, expected", [
+        ("my-project", "my_project"),
+        ("MyProject", "my_project"),
+        ("myProject2", "my_project2"),
+        ("HTTPServer", "http_server"),
+        ("getHTTPResponseCode", "get_http_response_code"),
+        ("project123", "project123"),
+        ("Project-Name", "project__name"),
+        ("already_snake", "already_snake"),
+        ("", ""),
+    ])
+    def test_known_names(self, name, expected):
+        """Test conversion of typical project names"""
+        assert to_snake_case(name) == expected
+    
+    def test_matches_regex_on_all_short_strings(self):
+        """Test that the scanner agrees with the regexes on every short string"""
+        alphabet = "aB1_-Ü."
+        for length in range(1, 6):
+            for chars in itertools.product(alphabet, repeat=length):
+                name = ''.join(chars)
+                assert to_snake_case(name) == regex_snake_case(name), name
+    
+    def test_newlines_use_regex(self):
+        """Test that names with newlines keep the regex behavior"""
+        name = "ab\nCdEf"
+        assert to_snake_case(name) == regex_snake_case(name)
+    
+    def test_pascal_case(self):
+        """Test PascalCase conversion of separated names"""
+        assert to_pascal_case("my-cool_project") == "MyCoolProject"
+
+
+class TestRepositoryDetection:
+    """Test class for GitHub remote parsing and .git/config reading"""
+    
+    @pytest.mark.parametrize("url, expected", [
+        ("git@github.com:owner/repo.git", ("owner", "repo")),
+        ("git@github.com:owner/repo", ("owner", "repo")),
+        ("https://github.com/owner/repo.git", ("owner", "repo")),
+        ("https://github.com/owner/repo", ("owner", "repo")),
+        ("https://github.com/owner/repo/", ("owner", "repo")),
+        ("ssh://git@github.com/owner/my.repo.git", ("owner", "my.repo")),
+    ])
+    def test_github_url_parsing(self, url, expected):
+        """Test owner and name extraction from GitHub remote URLs"""
+        match = _GITHUB_URL_RE.search(url)
+        assert match is not None
+        assert (match.group(1), match.group(2)) == expected
+    
+    @pytest.mark.parametrize("url", [
+        "https://gitlab.com/owner/repo.git",
+        "git@bitbucket.org:owner/repo.git",
+    ])
+    def test_non_github_url(self, url):
+        """Test that other hosts are not treated as GitHub"""
+        assert _GITHUB_URL_RE.search(url) is None
+    
+    def test_read_origin_url_from_git_config(self, tmp_path):
+        """Test reading the origin URL straight from .git/config"""
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "config").write_text(
+            '[core]\n'
+            '\trepositoryformatversion = 0\n'
+            '[remote "upstream"]\n'
+            '\turl = git@github.com:other/fork.git\n'
+            '[remote "origin"]\n'
+            '\turl = https://github.com/owner/repo.git\n'
+            '\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+        )
+        
+        assert read_origin_url(str(tmp_path)) == "https://github.com/owner/repo.git"
+    
+    def test_read_origin_url_without_git_dir(self, tmp_path):
+        """Test that a missing .git directory defers to git itself"""
+        assert read_origin_url(str(tmp_path)) is None
+    
+    def test_read_origin_url_without_origin(self, tmp_path):
+        """Test that a config without an origin remote yields None"""
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "config").write_text('[core]\n\tbare = false\n')
+        
+        assert read_origin_url(str(tmp_path)) is None
+    
+    def test_detect_repository_info(self, tmp_path, monkeypatch):
+        """Test repository detection from .git/config and the fallback"""
+        generate_module._detect_repository_info.cache_clear()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: subprocess.CompletedProcess(args, 1, "", ""))
+        
+        assert detect_repository_info({"project_name": "demo"}) == ("your-username", "demo")
+        
+        generate_module._detect_repository_info.cache_clear()
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "config").write_text('[remote "origin"]\n\turl = git@github.com:owner/repo.git\n')
+        
+        assert detect_repository_info({"project_name": "demo"}) == ("owner", "repo")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Tests for the CLI entry point
+
+This module contains unit tests for the lazily loaded command group.
+"""
+
+import pytest
+import importlib
+import click
+from click.testing import CliRunner
+
+from pipeline_creator.main import cli, LazyGroup, LAZY_SUBCOMMANDS, LAZY_SUBCOMMAND_HELP
+
+
+class TestLazyGroup:
+    """Test class for the lazy command group"""
+    
+    def setup_method(self):
+        """Set up test environment before each test"""
+        self.runner = CliRunner()
+    
+    def test_every_subcommand_has_help(self):
+        """Test that each lazy subcommand has a help entry"""
+        assert set(LAZY_SUBCOMMAND_HELP) == set(LAZY_SUBCOMMANDS)
+    
+    @pytest.mark.parametrize("name", sorted(LAZY_SUBCOMMANDS))
+    def test_subcommand_resolves(self, name):
+        """Test that each lazy subcommand imports to a click command"""
+        module_name, attr_name = LAZY_SUBCOMMANDS[name].split(":")
+        command = getattr(importlib.import_module(module_name), attr_name)
+        
+        assert isinstance(command, click.Command)
+    
+    @pytest.mark.parametrize("name", sorted(LAZY_SUBCOMMANDS))
+    def test_help_matches_command(self, name):
+        """Test that the listed help is the command's own short help"""
+        module_name, attr_name = LAZY_SUBCOMMANDS[name].split(":")
+        command = getattr(importlib.import_module(module_name), attr_name)
+        
+        assert command.get_short_help_str(limit=200) == LAZY_SUBCOMMAND_HELP[name]
+    
+    def test_help_does_not_load_commands(self):
+        """Test that --help lists commands without importing them"""
+        group = LazyGroup(name="pipeline", lazy_subcommands=LAZY_SUBCOMMANDS, lazy_help=LAZY_SUBCOMMAND_HELP)
+        result = self.runner.invoke(group, ['--help'])
+        
+        assert result.exit_code == 0
+        for name in LAZY_SUBCOMMANDS:
+            assert name in result.output
+        assert group.commands == {}
+    
+    def test_lists_all_subcommands(self):
+        """Test that every lazy subcommand is listed"""
+        group = LazyGroup(name="pipeline", lazy_subcommands=LAZY_SUBCOMMANDS)
+        
+        assert group.list_commands(None) == sorted(LAZY_SUBCOMMANDS)
+    
+    def test_subcommand_loads_on_use(self):
+        """Test that invoking a subcommand loads only that command"""
+        group = LazyGroup(name="pipeline", lazy_subcommands=LAZY_SUBCOMMANDS)
+        result = self.runner.invoke(group, ['init', '--help'])
+        
+        assert result.exit_code == 0
+        assert list(group.commands) == ["init"]
+    
+    def test_unknown_command(self):
+        """Test that an unknown subcommand is reported"""
+        result = self.runner.invoke(cli, ['nonexistent'])
+        
+        assert result.exit_code != 0
+        assert "No such command" in result.output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,346 @@
+"""
+Tests for notification delivery
+
+This module contains unit tests for HTTP retries, duplicate suppression and
+event coalescing, using a fake HTTP session in place of aiohttp.
+"""
+
+import pytest
+import aiohttp
+import asyncio
+import json
+import time
+
+from pipeline_creator.notifications import channels
+from pipeline_creator.notifications.channels import WebhookChannel, SlackChannel
+from pipeline_creator.notifications.event_handlers import PipelineEventHandler
+from pipeline_creator.notifications.notification_service import (
+    NotificationEventType, NotificationPriority, context_fingerprint
+)
+
+
+# Outcome of a request that never answers
+HANG = "hang"
+
+# asyncio.sleep is replaced in the session fixture
+_real_sleep = asyncio.sleep
+
+
+class FakeResponse:
+    """Response context manager returned by FakeSession.request"""
+    
+    def __init__(self, outcome, timeout=None):
+        # A (status, headers) tuple answers with headers
+        if isinstance(outcome, tuple):
+            outcome, self.headers = outcome
+        else:
+            self.headers = {}
+        self.outcome = outcome
+        self.timeout = timeout
+        self.status = outcome if isinstance(outcome, int) else None
+    
+    async def __aenter__(self):
+        if self.outcome == HANG:
+            # Like aiohttp, give up once the request timeout passes
+            if self.timeout is None:
+                await asyncio.Event().wait()
+            await _real_sleep(self.timeout.total)
+            raise asyncio.TimeoutError()
+        if isinstance(self.outcome, BaseException):
+            raise self.outcome
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Records requests and answers them from a scripted list of outcomes"""
+    
+    def __init__(self, outcomes=None):
+        self.outcomes = list(outcomes or [])
+        self.requests = []
+    
+    def request(self, method, url, timeout=None, **kwargs):
+        self.requests.append((method, url, timeout, kwargs))
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        return FakeResponse(outcome, timeout)
+
+
+MESSAGE = {"title": "Pipeline failed", "description": "Build broke", "context": {"project": "demo"}}
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Route channel HTTP traffic to a fake session and skip all delays"""
+    fake = FakeSession()
+    
+    async def get_http_session():
+        return fake
+    
+    real_sleep = asyncio.sleep
+    fake.delays = []
+    
+    async def sleep(delay, *args):
+        fake.delays.append(delay)
+        await real_sleep(0)
+    
+    async def wait_for_host_slot(url):
+        pass
+    
+    monkeypatch.setattr(channels, "get_http_session", get_http_session)
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    monkeypatch.setattr(channels, "_wait_for_host_slot", wait_for_host_slot)
+    return fake
+
+
+def send(channel, message=MESSAGE, event_type=NotificationEventType.PIPELINE_FAILED):
+    """Send a message through a channel on a fresh event loop"""
+    return asyncio.run(channel.send(message, event_type, NotificationPriority.HIGH))
+
+
+class TestRetry:
+    """Test class for retries of outbound HTTP sends"""
+    
+    def test_server_errors_are_retried(self, session):
+        """Test that 5xx responses are retried with growing backoff"""
+        session.outcomes = [503, 502, 200]
+        webhook = WebhookChannel({"enabled": True, "urls": ["https://hooks.example.com/a"]})
+        
+        assert send(webhook) == True
+        assert len(session.requests) == 3
+        backoff = [delay for delay in session.delays if delay > 0]
+        assert len(backoff) == 2
+        assert backoff[0] < backoff[1]
+    
+    def test_rate_limited_is_retried(self, session):
+        """Test that a 429 response is retried after the Retry-After delay"""
+        session.outcomes = [(429, {"Retry-After": "1"}), 200]
+        webhook = WebhookChannel({"enabled": True, "urls": ["https://hooks.example.com/a"]})
+        
+        assert send(webhook) == True
+        assert len(session.requests) == 2
+        assert 1 in session.delays
+    
+    def test_retry_after_is_capped(self, session):
+        """Test that a long Retry-After is capped at the backoff limit"""
+        session.outcomes = [(429, {"Retry-After": "3600"}), 200]
+        webhook = WebhookChannel({"enabled": True, "urls": ["https://hooks.example.com/a"], "timeout": 60})
+        
+        assert send(webhook) == True
+        assert max(session.delays) == channels._HTTP_MAX_BACKOFF
+    
+    def test_gives_up_after_max_attempts(self, session):
+        """Test that a persistently failing endpoint is tried a bounded number of times"""
+        session.outcomes = [500] * 10
+        webhook = WebhookChannel({"enabled": True, "urls": ["https://hooks.example.com/a"]})
+        
+        assert send(webhook) == False
+        assert len(session.requests) == channels._HTTP_MAX_ATTEMPTS
+    
+    def test_client_errors_are_not_retried(self, session):
+        """Test that a 4xx response fails without a retry"""
+        session.outcomes = [404]
+        slack = SlackChannel({"enabled": True, "webhook_url": "https://hooks.slack.com/x"})
+        
+        assert send(slack) == False
+        assert len(session.requests) == 1
+    
+    def test_network_errors_are_retried(self, session):
+        """Test that connection errors are retried"""
+        session.outcomes = [aiohttp.ClientConnectionError(), 200]
+        slack = SlackChannel({"enabled": True, "webhook_url": "https://hooks.slack.com/x"})
+        
+        assert send(slack) == True
+        assert len(session.requests) == 2
+
+
+class TestDeadline:
+    """Test class for send deadlines"""
+    
+    def test_hung_send_times_out(self, session):
+        """Test that an endpoint that never answers fails the send"""
+        session.outcomes = [HANG] * 10
+        slack = SlackChannel({"enabled": True, "webhook_url": "https://hooks.slack.com/x", "timeout": 0.05})
+        
+        started = time.perf_counter()
+        assert send(slack) == False
+        assert time.perf_counter() - started < 1
+    
+    def test_timeouts_apply_per_attempt(self, session):
+        """Test that each attempt is bounded by the deadline and timeouts are retried"""
+        session.outcomes = [asyncio.TimeoutError(), asyncio.TimeoutError(), 200]
+        slack = SlackChannel({"enabled": True, "webhook_url": "https://hooks.slack.com/x", "timeout": 3})
+        
+        assert send(slack) == True
+        assert len(session.requests) == 3
+        assert all(0 < timeout.total <= 3 for _, _, timeout, _ in session.requests)
+    
+    def test_deadline_covers_all_attempts(self, session):
+        """Test that retries of a hung endpoint stop at the channel timeout"""
+        session.outcomes = [HANG] * 10
+        webhook = WebhookChannel({"enabled": True, "urls": ["https://hooks.example.com/a"], "timeout": 0.2})
+        
+        started = time.perf_counter()
+        assert send(webhook) == False
+        assert time.perf_counter() - started < 0.2 * 2
+    
+    def test_no_retry_past_the_deadline(self, session):
+        """Test that a server error is not retried when the backoff would overrun the deadline"""
+        session.outcomes = [503, 200]
+        webhook = WebhookChannel({"enabled": True, "urls": ["https://hooks.example.com/a"], "timeout": 0.1})
+        
+        assert send(webhook) == False
+        assert len(session.requests) == 1
+
+
+class TestDuplicateSuppression:
+    """Test class for per-channel duplicate suppression"""
+    
+    def test_repeat_is_skipped(self, session):
+        """Test that an identical message sent again is reported as skipped"""
+        webhook = WebhookChannel({"enabled": True, "urls": ["https://hooks.example.com/a"]})
+        
+        assert send(webhook) == True
+        assert send(webhook) is None
+        assert len(session.requests) == 1
+        assert webhook.deduplicated_count == 1
+    
+    def test_timestamp_is_ignored(self, session):
+        """Test that messages differing only in timestamp are duplicates"""
+        webhook = WebhookChannel({"enabled": True, "urls": ["https://hooks.example.com/a"]})
+        later = dict(MESSAGE, context={"project": "demo", "timestamp": "2024-01-01T00:00:00Z"})
+        
+        send(webhook)
+        
+        assert send(webhook, later) is None
+        assert len(session.requests) == 1
+    
+    def test_failed_send_is_not_suppressed(self, session):
+        """Test that a message is retried by the caller after a failed send"""
+        session.outcomes = [404, 200]
+        webhook = WebhookChannel({"enabled": True, "urls": ["https://hooks.example.com/a"]})
+        
+        assert send(webhook) == False
+        assert send(webhook) == True
+    
+    def test_disabled_channel_sends_nothing(self, session):
+        """Test that a disabled channel fails without a request"""
+        slack = SlackChannel({"enabled": False, "webhook_url": "https://hooks.slack.com/x"})
+        
+        assert send(slack) == False
+        assert session.requests == []
+    
+    def test_context_fingerprint_mixed_keys(self):
+        """Test that contexts with mixed key types can be fingerprinted"""
+        assert context_fingerprint({1: "a", "b": 2}) == context_fingerprint({"b": 2, 1: "a"})
+
+
+class TestCoalescing:
+    """Test class for batching of queued pipeline events"""
+    
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """Write a config with a single webhook channel"""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({
+            "notifications": {
+                "webhooks": {"enabled": True, "urls": ["https://hooks.example.com/a"]},
+                "rules": {"events": {}}
+            }
+        }))
+        return str(path)
+    
+    def test_burst_of_identical_events_is_sent_once(self, session, config_path):
+        """Test that identical events queued together share one send"""
+        async def burst():
+            async with PipelineEventHandler(config_path) as handler:
+                return await asyncio.gather(*(
+                    handler.send_pipeline_failure("demo", "main", "abc123") for _ in range(5)
+                ))
+        
+        assert asyncio.run(burst()) == [True] * 5
+        assert len(session.requests) == 1
+    
+    def test_distinct_events_are_all_sent(self, session, config_path):
+        """Test that different events in one batch are each sent"""
+        async def burst():
+            async with PipelineEventHandler(config_path) as handler:
+                return await asyncio.gather(*(
+                    handler.send_pipeline_failure("demo", "main", "abc123", stage=f"stage{i}")
+                    for i in range(3)
+                ))
+        
+        assert asyncio.run(burst()) == [True] * 3
+        assert len(session.requests) == 3
+    
+    def test_lone_event_is_not_delayed(self, session, config_path):
+        """Test that a single event does not wait out the coalesce window"""
+        async def single():
+            async with PipelineEventHandler(config_path) as handler:
+                started = time.perf_counter()
+                result = await handler.send_pipeline_failure("demo", "main", "abc123")
+                return result, time.perf_counter() - started, handler._flusher.done()
+        
+        result, elapsed, flusher_done = asyncio.run(single())
+        
+        assert result == True
+        assert elapsed < PipelineEventHandler.COALESCE_WINDOW
+        assert flusher_done
+    
+    def test_failing_batch_does_not_hang(self, session, config_path):
+        """Test that an error while sending a batch reaches every waiter"""
+        async def failing():
+            async with PipelineEventHandler(config_path) as handler:
+                async def broken_send(*args, **kwargs):
+                    raise RuntimeError("boom")
+                
+                handler.notification_service.send_notification = broken_send
+                return await asyncio.wait_for(
+                    asyncio.gather(*(
+                        handler.send_pipeline_failure("demo", "main", "abc123") for _ in range(3)
+                    )),
+                    timeout=5
+                )
+        
+        assert asyncio.run(failing()) == [False] * 3
+    
+    def test_close_during_window_releases_waiters(self, session, config_path):
+        """Test that closing the handler mid-batch fails every pending event"""
+        async def close_early():
+            handler = PipelineEventHandler(config_path)
+            producers = [
+                asyncio.ensure_future(handler.send_pipeline_failure("demo", "main", "abc123", stage=f"stage{i}"))
+                for i in range(3)
+            ]
+            await _real_sleep(PipelineEventHandler.COALESCE_WINDOW / 4)
+            await handler.aclose()
+            return await asyncio.wait_for(asyncio.gather(*producers), timeout=5)
+        
+        assert asyncio.run(close_early()) == [False] * 3
+        assert session.requests == []
+    
+    def test_close_releases_queued_events(self, session, config_path):
+        """Test that events queued behind a send in progress are failed on close"""
+        async def close_with_backlog():
+            handler = PipelineEventHandler(config_path)
+            
+            async def hung_send(*args, **kwargs):
+                await asyncio.Event().wait()
+            
+            handler.notification_service.send_notification = hung_send
+            first = asyncio.ensure_future(handler.send_pipeline_failure("demo", "main", "abc123"))
+            await _real_sleep(0.01)
+            queued = [
+                asyncio.ensure_future(handler.send_pipeline_failure("demo", "main", "abc123", stage=f"stage{i}"))
+                for i in range(2)
+            ]
+            await _real_sleep(0.01)
+            await handler.aclose()
+            return await asyncio.wait_for(asyncio.gather(first, *queued), timeout=5)
+        
+        assert asyncio.run(close_with_backlog()) == [False] * 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
\ No newline at end of file